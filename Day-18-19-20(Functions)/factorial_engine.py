@@ -0,0 +1,208 @@
+"""
+========================================
+  Factorial Engine
+========================================
+
+factorial(n) is written again and again in Practices.py, p19.py, p20.py
+and Logic-buildings.py - always as recursion (RecursionError near
+n=1000) or as a loop 1*2*3*...*n. The loop multiplies one huge number
+by one small number n times, so the cost grows about quadratically.
+
+This module computes factorials with a product tree (binary splitting):
+
+    product(1..8) = ((1*2) * (3*4)) * ((5*6) * (7*8))
+
+Numbers of about the same size are multiplied together, which is what
+Python's big-int multiplication (Karatsuba) is fast at. The factors of
+2 are taken out first and added back with a single shift, and every odd
+number is multiplied in only once (the same scheme math.factorial uses).
+
+- factorial(n)       - uses the nearest cached factorial below n and
+                       multiplies only the missing range on top of it.
+- factorial_many(ns) - a whole list of requests: sorted, each answer is
+                       the previous answer times the product of the gap,
+                       so the partial products are shared.
+- A small LRU cache keeps the most recently computed factorials.
+
+factorial(1_000_000) takes seconds; the loop takes many minutes.
+
+How to use:
+    from factorial_engine import factorial, factorial_many
+    print(factorial(20))                  # 2432902008176640000
+    print(factorial_many([5, 3, 10]))     # [120, 6, 3628800]
+"""
+from collections import OrderedDict
+
+LEAF_SIZE = 32       # ranges this short are multiplied with a plain loop
+CACHE_SIZE = 16      # how many recent factorials are kept
+
+
+def check(n):
+    if n < 0:
+        raise ValueError("Factorial is not defined for negative numbers")
+
+
+# Original loop version, kept for the benchmark
+def factorial_loop(n):
+    result = 1
+    for i in range(2, n + 1):
+        result *= i
+    return result
+
+
+# ===============================
+# Product tree
+# ===============================
+
+# Product of the odd numbers in (low, high], by binary splitting
+def odd_product(low, high):
+    first = low + 1 if low % 2 == 0 else low + 2   # first odd number > low
+    count = (high - first) // 2 + 1
+    if count <= 0:
+        return 1
+    return _odd_product(first, count)
+
+
+# Product of `count` odd numbers starting at `first`
+def _odd_product(first, count):
+    if count <= LEAF_SIZE:
+        result = 1
+        for i in range(first, first + 2 * count, 2):
+            result *= i
+        return result
+    half = count // 2
+    return _odd_product(first, half) * _odd_product(first + 2 * half, count - half)
+
+
+# n! from scratch. Its odd part is the product of the odd parts of
+# (0, n], (0, n/2], (0, n/4], ...; each one is the next smaller one times
+# the odd numbers in (n/2**(i+1), n/2**i], so every odd number is
+# multiplied in only once. The 2s (Legendre: n - ones in binary n) are
+# added with one shift.
+def factorial_tree(n):
+    inner = outer = 1
+    for i in range(n.bit_length() - 1, -1, -1):
+        inner *= odd_product(n >> (i + 1), n >> i)
+        outer *= inner
+    return outer << (n - bin(n).count("1"))
+
+
+# Product of the integers in (low, high] = high! / low!
+def range_product(low, high):
+    if high <= low:
+        return 1
+    if low == 0:
+        return factorial_tree(high)
+    # Each even number 2m in the range gives one factor 2 and the number m:
+    # the odd parts are collected level by level (m, m/2, ...), the 2s apart
+    parts, shift = [], 0
+    while high > low:
+        parts.append(odd_product(low, high))
+        shift += high // 2 - low // 2          # even numbers in (low, high]
+        low, high = low // 2, high // 2
+    odd = 1
+    for part in reversed(parts):               # small parts first
+        odd *= part
+    return odd << shift
+
+
+# ===============================
+# Cache of recent factorials
+# ===============================
+_cache = OrderedDict()
+
+
+def cache_put(n, value):
+    _cache[n] = value
+    _cache.move_to_end(n)
+    while len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+
+
+# Largest cached n' <= n, with n'! (or 0, 1 if nothing helps)
+def nearest_cached(n):
+    best = max((m for m in _cache if m <= n), default=None)
+    if best is None:
+        return 0, 1
+    _cache.move_to_end(best)
+    return best, _cache[best]
+
+
+def cache_clear():
+    _cache.clear()
+
+
+# ===============================
+# Public functions
+# ===============================
+def factorial(n):
+    check(n)
+    start, value = nearest_cached(n)
+    if start != n:
+        value *= range_product(start, n)
+        cache_put(n, value)
+    return value
+
+
+def factorial_many(ns):
+    ns = list(ns)
+    for n in ns:
+        check(n)
+    results = {}
+    wanted = sorted(set(ns))
+    if wanted:
+        position, value = nearest_cached(wanted[0])
+        for n in wanted:
+            value *= range_product(position, n)     # shared with all larger n
+            position = n
+            results[n] = value
+        cache_put(position, value)
+    return [results[n] for n in ns]
+
+
+# ===============================
+# Benchmark
+# ===============================
+def benchmark(sizes=(1_000, 10_000, 100_000)):
+    import time
+
+    for n in sizes:
+        start = time.perf_counter()
+        slow = factorial_loop(n)
+        loop_time = time.perf_counter() - start
+
+        cache_clear()
+        start = time.perf_counter()
+        fast = factorial(n)
+        tree_time = time.perf_counter() - start
+
+        assert slow == fast
+        print(f"n={n:>8,}  loop {loop_time:.4f}s  product tree {tree_time:.4f}s")
+
+
+if __name__ == "__main__":
+    sales_data = [
+        ("Laptop", 50000, 2, "Rahul"),
+        ("Mobile", 15000, 5, "Shalini"),
+        ("Tablet", 20000, 3, "Amit"),
+        ("Laptop", 50000, 1, "Shalini"),
+        ("Headphones", 2000, 10, "Rahul"),
+        ("Charger", 800, 15, "Amit"),
+        ("Mobile", 15000, 2, "Rahul"),
+        ("Laptop", 50000, 1, "Amit"),
+        ("Tablet", 20000, 1, "Shalini"),
+        ("Headphones", 2000, 5, "Rahul")
+    ]
+    print("Factorial of Number of Transactions:", factorial(len(sales_data)))
+    print("factorial_many([5, 3, 10]):", factorial_many([5, 3, 10]))
+    print()
+    benchmark()
+
+    import time
+    cache_clear()
+    start = time.perf_counter()
+    big = factorial(1_000_000)
+    print(f"\nfactorial(1,000,000): {big.bit_length():,} bits in {time.perf_counter() - start:.2f}s")
+    start = time.perf_counter()
+    factorial(1_000_010)
+    print(f"factorial(1,000,010) from the cache: {time.perf_counter() - start:.4f}s")
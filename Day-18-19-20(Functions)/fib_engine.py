@@ -0,0 +1,139 @@
+"""
+========================================
+  Fibonacci Engine
+========================================
+
+fibonacci(n) in Practices.py (Section 7) and fib(n) in p20.py call
+themselves twice per step - exponential time - and
+[fibonacci(i) for i in range(7)] recomputes every earlier value again.
+
+Three faster modes:
+
+1. fib_memo(n)   - LRU-memoized recursion (functools.lru_cache).
+                   Every value is computed once; the cache is filled in
+                   steps so the recursion never gets deep.
+2. fib_fast(n)   - fast doubling, O(log n) big-int multiplications:
+                       F(2k)   = F(k) * (2*F(k+1) - F(k))
+                       F(2k+1) = F(k)**2 + F(k+1)**2
+                   (the same as squaring the matrix [[1, 1], [1, 0]]).
+                   Handles n in the millions.
+3. fib_many(ns)  - a whole list of requests in one sweep: the requests
+                   are sorted, small gaps are walked step by step and
+                   big gaps are jumped with fast doubling.
+
+How to use:
+    from fib_engine import fib_fast, fib_many
+    print(fib_fast(1000))
+    print(fib_many(range(7)))        # [0, 1, 1, 2, 3, 5, 8]
+"""
+from functools import lru_cache
+
+MEMO_STEP = 200      # recursion depth per cache-filling step
+WALK_LIMIT = 64      # gaps up to this are walked one step at a time
+
+
+def check(n):
+    if n < 0:
+        raise ValueError("Fibonacci is not defined for negative n")
+
+
+# Original version, kept for the benchmark
+def fib_naive(n):
+    if n <= 1:
+        return n
+    return fib_naive(n - 1) + fib_naive(n - 2)
+
+
+# ===============================
+# 1. Memoized
+# ===============================
+@lru_cache(maxsize=4096)
+def _fib_cached(n):
+    if n <= 1:
+        return n
+    return _fib_cached(n - 1) + _fib_cached(n - 2)
+
+
+def fib_memo(n):
+    check(n)
+    # Fill the cache bottom-up in steps of MEMO_STEP, so each call below
+    # only recurses until it reaches values cached by the previous step
+    for k in range(MEMO_STEP, n, MEMO_STEP):
+        _fib_cached(k)
+    return _fib_cached(n)
+
+
+# ===============================
+# 2. Fast doubling
+# ===============================
+
+# Returns (F(n), F(n+1))
+def fib_pair(n):
+    a, b = 0, 1                      # F(0), F(1)
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)          # F(2k)
+        d = a * a + b * b            # F(2k+1)
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a, b
+
+
+def fib_fast(n):
+    check(n)
+    return fib_pair(n)[0]
+
+
+# ===============================
+# 3. Batched
+# ===============================
+def fib_many(ns):
+    ns = list(ns)
+    for n in ns:
+        check(n)
+    results = {}
+    position, a, b = 0, 0, 1         # a = F(position), b = F(position + 1)
+    for n in sorted(set(ns)):
+        gap = n - position
+        if gap <= WALK_LIMIT:
+            for _ in range(gap):
+                a, b = b, a + b
+        else:
+            # F(p+d) = F(p)*(F(d+1) - F(d)) + F(p+1)*F(d)   [F(d-1) = F(d+1) - F(d)]
+            # F(p+d+1) = F(p)*F(d) + F(p+1)*F(d+1)
+            fd, fd1 = fib_pair(gap)
+            a, b = a * (fd1 - fd) + b * fd, a * fd + b * fd1
+        position = n
+        results[n] = a
+    return [results[n] for n in ns]
+
+
+# ===============================
+# Benchmark
+# ===============================
+def benchmark(n=30):
+    import time
+
+    for name, func in [("naive", fib_naive), ("memo", fib_memo), ("fast doubling", fib_fast)]:
+        _fib_cached.cache_clear()
+        start = time.perf_counter()
+        value = func(n)
+        print(f"{name:<14} fib({n}) = {value}  {time.perf_counter() - start:.6f}s")
+
+    start = time.perf_counter()
+    naive_list = [fib_naive(i) for i in range(n + 1)]
+    naive_time = time.perf_counter() - start
+    start = time.perf_counter()
+    batch = fib_many(range(n + 1))
+    batch_time = time.perf_counter() - start
+    assert batch == naive_list
+    print(f"[fib(i) for i in range({n + 1})]: naive {naive_time:.4f}s, fib_many {batch_time:.6f}s")
+
+
+if __name__ == "__main__":
+    print("First 7 Fibonacci numbers:", fib_many(range(7)))
+    print("fib(100) =", fib_fast(100))
+    print("Bits in fib(1,000,000):", fib_fast(1_000_000).bit_length())
+    print()
+    benchmark(30)
@@ -0,0 +1,143 @@
+"""
+========================================
+  Tower of Hanoi - Move Stream
+========================================
+
+hanoi(n, source, target, aux) in Practices.py (Section 7) prints its
+moves from inside the recursion: other code cannot use them, and large n
+is out of reach (2**n - 1 moves, all printed).
+
+The moves follow a bit pattern. Number them m = 1, 2, ..., 2**n - 1:
+
+    disk moved = number of trailing zero bits of m, plus 1
+    from peg   = (m & (m - 1)) % 3
+    to peg     = ((m | (m - 1)) + 1) % 3
+
+with pegs 0, 1, 2 = source, aux, target for odd n (source, target, aux
+for even n). So:
+
+1. hanoi_moves(n)        - generator of (disk, from, to), O(1) memory,
+                           no recursion.
+2. hanoi_move(n, k)      - the k-th move directly, in O(n) bit operations.
+3. hanoi_batch(...)      - moves start..stop-1 computed with NumPy into a
+                           preallocated (rows, 3) uint8 array;
+   iter_move_chunks(n)   - reuses one buffer chunk after chunk, so n=30
+                           (about 10**9 moves) runs in fixed memory.
+
+How to use:
+    from hanoi_engine import hanoi_moves, hanoi_move
+    for disk, source, target in hanoi_moves(3, "A", "C", "B"):
+        print(f"Move disk {disk} from {source} to {target}")
+    print(hanoi_move(64, 2**63))          # (64, 'A', 'C') - the middle move
+"""
+import numpy as np
+
+DEFAULT_CHUNK = 1 << 22      # moves per NumPy chunk (12 MB buffer)
+
+
+def peg_labels(n, source, target, aux):
+    return (source, aux, target) if n % 2 else (source, target, aux)
+
+
+def move_count(n):
+    return 2 ** n - 1
+
+
+# ===============================
+# 1. Move generator
+# ===============================
+def hanoi_moves(n, source="A", target="C", aux="B"):
+    labels = peg_labels(n, source, target, aux)
+    for m in range(1, 2 ** n):
+        disk = (m & -m).bit_length()
+        yield disk, labels[(m & (m - 1)) % 3], labels[((m | (m - 1)) + 1) % 3]
+
+
+# ===============================
+# 2. Direct lookup
+# ===============================
+
+# The k-th move (k = 1 .. 2**n - 1) as (disk, from, to)
+def hanoi_move(n, k, source="A", target="C", aux="B"):
+    if not 1 <= k <= move_count(n):
+        raise IndexError(f"move {k} out of range 1..{move_count(n)}")
+    labels = peg_labels(n, source, target, aux)
+    disk = (k & -k).bit_length()
+    return disk, labels[(k & (k - 1)) % 3], labels[((k | (k - 1)) + 1) % 3]
+
+
+# ===============================
+# 3. Batched with NumPy
+# ===============================
+
+# Moves start .. stop-1 written into out[:stop - start] as rows of
+# (disk, from peg, to peg); pegs are 0 = source, 1 = target, 2 = aux.
+def hanoi_batch(n, start, stop, out=None):
+    if n > 63:
+        raise ValueError("hanoi_batch works on 64-bit move numbers (n <= 63)")
+    start = max(start, 1)
+    stop = min(stop, move_count(n) + 1)
+    rows = max(stop - start, 0)
+    if out is None:
+        out = np.empty((rows, 3), dtype=np.uint8)
+    m = np.arange(start, stop, dtype=np.uint64)
+    one = np.uint64(1)
+    # lowest set bit of m is 2**(disk - 1); frexp(2**e) gives exponent e + 1
+    out[:rows, 0] = np.frexp((m & (~m + one)).astype(np.float64))[1]
+    source = (m & (m - one)) % np.uint64(3)
+    target = ((m | (m - one)) + one) % np.uint64(3)
+    if n % 2:
+        # formula pegs (source, aux, target) → (0, 2, 1)
+        source = (3 - source) % 3
+        target = (3 - target) % 3
+    out[:rows, 1] = source
+    out[:rows, 2] = target
+    return out[:rows]
+
+
+# All moves in chunks of `chunk` rows. The same buffer is refilled for
+# every chunk - copy a chunk if it has to outlive the next iteration.
+def iter_move_chunks(n, chunk=DEFAULT_CHUNK):
+    buffer = np.empty((chunk, 3), dtype=np.uint8)
+    for start in range(1, move_count(n) + 1, chunk):
+        yield hanoi_batch(n, start, start + chunk, buffer)
+
+
+# Stream every move once and count moves per disk (disk d moves 2**(n-d) times)
+def simulate(n, chunk=DEFAULT_CHUNK):
+    per_disk = np.zeros(n + 1, dtype=np.int64)
+    for moves in iter_move_chunks(n, chunk):
+        per_disk += np.bincount(moves[:, 0], minlength=n + 1)
+    return per_disk[1:]
+
+
+# Play moves on three stacks and check every one is legal
+def check_moves(n, moves):
+    pegs = {0: list(range(n, 0, -1)), 1: [], 2: []}
+    for disk, source, target in moves:
+        if not pegs[source] or pegs[source][-1] != disk:
+            raise ValueError(f"disk {disk} is not on top of peg {source}")
+        if pegs[target] and pegs[target][-1] < disk:
+            raise ValueError(f"disk {disk} cannot go on top of disk {pegs[target][-1]}")
+        pegs[target].append(pegs[source].pop())
+    return len(pegs[1]) == n
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    for disk, source, target in hanoi_moves(3, "A", "C", "B"):
+        print(f"Move disk {disk} from {source} to {target}")
+
+    print("\nMove 2**63 of 64 disks:", hanoi_move(64, 2 ** 63))
+    print("Last move of 64 disks:", hanoi_move(64, move_count(64)))
+
+    print("\nBatch of 10 disks, all moves legal:",
+          check_moves(10, hanoi_batch(10, 1, move_count(10) + 1).tolist()))
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 25
+    start = time.perf_counter()
+    per_disk = simulate(n)
+    print(f"{n} disks: {per_disk.sum():,} moves streamed in "
+          f"{time.perf_counter() - start:.1f}s; disk 1 moved {per_disk[0]:,} times")
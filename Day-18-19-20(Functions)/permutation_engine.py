@@ -0,0 +1,199 @@
+"""
+========================================
+  Permutation Engine
+========================================
+
+permute(s) in Practices.py (Section 7) prints every permutation while
+building new strings with slicing and concatenation at each level. The
+output cannot be used by other code, cannot be stopped after the first
+few results, and "aab" prints "aab" twice.
+
+This module generates permutations lazily, in lexicographic order:
+
+- next_permutation(chars) - turns a list into the next permutation in
+                            place (a few swaps and one reversal);
+                            repeated characters are skipped over
+                            naturally, so every result is distinct.
+- permutations(s)         - generator; start/stop pick a range of ranks.
+- unrank(s, rank)         - the rank-th permutation directly, without
+                            generating the ones before it.
+- parallel_permutations() - splits the ranks 0..count-1 into ranges,
+                            each worker process unranks its start and
+                            walks its own range.
+
+How to use:
+    from permutation_engine import permutations, unrank
+    print(list(permutations("abc")))      # ['abc', 'acb', 'bac', ...]
+    print(list(permutations("aab")))      # ['aab', 'aba', 'baa']
+    print(unrank("abcd", 10))             # 'bdac'
+"""
+import math
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+
+# ===============================
+# Next permutation
+# ===============================
+
+# Rearrange `chars` (a list) into the next larger permutation.
+# Returns False (and leaves the last permutation) when there is none.
+def next_permutation(chars):
+    # 1. rightmost i with chars[i] < chars[i + 1]
+    i = len(chars) - 2
+    while i >= 0 and chars[i] >= chars[i + 1]:
+        i -= 1
+    if i < 0:
+        return False
+    # 2. rightmost j with chars[j] > chars[i], swap them
+    j = len(chars) - 1
+    while chars[j] <= chars[i]:
+        j -= 1
+    chars[i], chars[j] = chars[j], chars[i]
+    # 3. the tail is in descending order - reverse it with swaps
+    low, high = i + 1, len(chars) - 1
+    while low < high:
+        chars[low], chars[high] = chars[high], chars[low]
+        low += 1
+        high -= 1
+    return True
+
+
+# ===============================
+# Counting and unranking
+# ===============================
+
+# Number of distinct permutations: n! / (count of each repeated character)!
+def count_permutations(s):
+    total = math.factorial(len(s))
+    for count in Counter(s).values():
+        total //= math.factorial(count)
+    return total
+
+
+# The rank-th distinct permutation of s in lexicographic order (rank 0 = sorted)
+def unrank(s, rank):
+    total = count_permutations(s)
+    if not 0 <= rank < total:
+        raise IndexError(f"rank {rank} out of range for {total} permutations")
+    counts = Counter(s)
+    remaining = len(s)
+    result = []
+    while remaining:
+        for ch in sorted(counts):
+            # permutations of the rest that start with ch
+            block = total * counts[ch] // remaining
+            if rank < block:
+                break
+            rank -= block
+        result.append(ch)
+        total = block
+        remaining -= 1
+        counts[ch] -= 1
+        if counts[ch] == 0:
+            del counts[ch]
+    return "".join(result)
+
+
+# Lexicographic rank of permutation p among the permutations of its characters
+def rank_of(p):
+    counts = Counter(p)
+    total = count_permutations(p)
+    remaining = len(p)
+    rank = 0
+    for ch in p:
+        for smaller in sorted(counts):
+            if smaller == ch:
+                break
+            rank += total * counts[smaller] // remaining
+        total = total * counts[ch] // remaining
+        remaining -= 1
+        counts[ch] -= 1
+        if counts[ch] == 0:
+            del counts[ch]
+    return rank
+
+
+# ===============================
+# Generator
+# ===============================
+
+# Distinct permutations of s with ranks start <= rank < stop
+def permutations(s, start=0, stop=None):
+    total = count_permutations(s)
+    stop = total if stop is None else min(stop, total)
+    if start >= stop:
+        return
+    chars = list(unrank(s, start))
+    for _ in range(stop - start - 1):
+        yield "".join(chars)
+        next_permutation(chars)
+    yield "".join(chars)
+
+
+# Prints like permute() in Practices.py (two spaces apart), but in
+# lexicographic order, each distinct permutation once, and ends the line.
+# The order only matches permute() when s is sorted with no repeats.
+def print_permutations(s, limit=None):
+    for p in islice(permutations(s), limit):
+        print(p, end="  ")
+    print()
+
+
+# ===============================
+# Splitting across processes
+# ===============================
+
+# Cut ranks 0..total-1 into `parts` contiguous (start, stop) ranges
+def split_ranks(total, parts):
+    parts = max(1, min(parts, total))
+    size, extra = divmod(total, parts)
+    ranges = []
+    start = 0
+    for i in range(parts):
+        stop = start + size + (1 if i < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def _run_range(task, s, start, stop):
+    return task(permutations(s, start, stop))
+
+
+# Run task(generator of permutations) on each rank range in a separate
+# process; returns the task results in rank order. `task` must be a
+# top-level function so it can be sent to the workers.
+def parallel_permutations(s, task, workers=None, parts=None):
+    workers = workers or os.cpu_count() or 1
+    ranges = split_ranks(count_permutations(s), parts or workers)
+    if workers == 1:
+        return [_run_range(task, s, start, stop) for start, stop in ranges]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_run_range, task, s, start, stop) for start, stop in ranges]
+        return [future.result() for future in futures]
+
+
+# Example task: how many permutations read the same backwards
+def count_palindromes(perms):
+    return sum(1 for p in perms if p == p[::-1])
+
+
+if __name__ == "__main__":
+    print("Permutations of 'abc':")
+    print_permutations("abc")
+    print("Permutations of 'aab' (no duplicates):", list(permutations("aab")))
+    print("First 5 of 'python':", list(islice(permutations("python"), 5)))
+    print("Rank 10 of 'abcd':", unrank("abcd", 10), "| rank of 'bcda':", rank_of("bcda"))
+
+    word = "aabbccddeef"
+    print(f"\n'{word}' has {count_permutations(word):,} distinct permutations")
+    print("Permutation #1,000,000:", unrank(word, 1_000_000))
+
+    import time
+    start = time.perf_counter()
+    palindromes = sum(parallel_permutations(word, count_palindromes))
+    print(f"Palindromic permutations: {palindromes} "
+          f"({time.perf_counter() - start:.2f}s on {os.cpu_count()} processes)")
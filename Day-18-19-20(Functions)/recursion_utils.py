@@ -0,0 +1,189 @@
+"""
+========================================
+  Recursion Utilities (no slicing, no depth limit)
+========================================
+
+The recursive list/string functions in Practices.py (Section 7) recurse
+on lst[1:] or s[1:]. Every call copies the rest of the sequence, so a
+list of n items costs O(n^2) time and memory, and Python stops them with
+RecursionError after about 1000 items.
+
+The versions here keep the recursive structure but:
+
+1. walk an index (i, or i and j from both ends) or an iterator over the original
+   sequence - nothing is copied;
+2. are written in accumulator (tail) form and run on a trampoline:
+   instead of calling itself, a step returns Bounce(next_step, args...)
+   and trampoline() keeps calling steps in a loop. The Python stack
+   never grows, so there is no depth limit.
+
+Results are the same as the originals: sums and products are folded
+right to left like lst[0] + sum_list(lst[1:]) would.
+
+How to use:
+    from recursion_utils import sum_list, is_palindrome
+    print(sum_list(range(1_000_000)))
+    print(is_palindrome("madam"))
+"""
+
+
+# ===============================
+# Trampoline
+# ===============================
+class Bounce:
+    def __init__(self, step, *args):
+        self.step = step
+        self.args = args
+
+
+def trampoline(step, *args):
+    result = step(*args)
+    while isinstance(result, Bounce):
+        result = result.step(*result.args)
+    return result
+
+
+# ===============================
+# List functions
+# ===============================
+
+# lst[i] + lst[i+1] + ... folded from the right end
+def _sum_from(lst, i, total):
+    if i < 0:
+        return total
+    return Bounce(_sum_from, lst, i - 1, lst[i] + total)
+
+
+def sum_list(lst):
+    return trampoline(_sum_from, lst, len(lst) - 1, 0)
+
+
+def _product_from(lst, i, result):
+    if i < 0:
+        return result
+    return Bounce(_product_from, lst, i - 1, lst[i] * result)
+
+
+def product_list(lst):
+    return trampoline(_product_from, lst, len(lst) - 1, 1)
+
+
+def _max_from(lst, i, best):
+    if i < 0:
+        return best
+    return Bounce(_max_from, lst, i - 1, max(lst[i], best))
+
+
+def find_max(lst):
+    if len(lst) == 0:
+        raise ValueError("find_max() of an empty list")
+    return trampoline(_max_from, lst, len(lst) - 2, lst[-1])
+
+
+def _count_from(lst, x, i, count):
+    if i == len(lst):
+        return count
+    return Bounce(_count_from, lst, x, i + 1, count + (lst[i] == x))
+
+
+def count_occ(lst, x):
+    return trampoline(_count_from, lst, x, 0, 0)
+
+
+# ===============================
+# String functions
+# ===============================
+_END = object()
+
+
+def _length_from(chars, count):
+    if next(chars, _END) is _END:
+        return count
+    return Bounce(_length_from, chars, count + 1)
+
+
+# Counts characters one at a time, like the original 1 + str_length(s[1:]),
+# but steps an iterator over s instead of slicing it
+def str_length(s):
+    return trampoline(_length_from, iter(s), 0)
+
+
+# Characters are collected in a list and joined once (s + ch in a loop
+# would copy the growing string every time)
+def _reverse_from(s, i, chars):
+    if i < 0:
+        return "".join(chars)
+    chars.append(s[i])
+    return Bounce(_reverse_from, s, i - 1, chars)
+
+
+def reverse_string(s):
+    return trampoline(_reverse_from, s, len(s) - 1, [])
+
+
+def _palindrome_between(s, i, j):
+    if i >= j:
+        return True
+    if s[i] != s[j]:
+        return False
+    return Bounce(_palindrome_between, s, i + 1, j - 1)
+
+
+def is_palindrome(s):
+    return trampoline(_palindrome_between, s, 0, len(s) - 1)
+
+
+# ===============================
+# Benchmark against the slicing versions
+# ===============================
+
+# Originals from Practices.py, Section 7
+def sum_list_sliced(lst):
+    if not lst:
+        return 0
+    return lst[0] + sum_list_sliced(lst[1:])
+
+
+def reverse_string_sliced(s):
+    if len(s) == 0:
+        return ""
+    return reverse_string_sliced(s[1:]) + s[0]
+
+
+def benchmark(n=900):
+    import time
+
+    numbers = list(range(n))
+    text = "ab" * (n // 2)
+    for name, slow, fast, data in [("sum_list", sum_list_sliced, sum_list, numbers),
+                                   ("reverse_string", reverse_string_sliced, reverse_string, text)]:
+        start = time.perf_counter()
+        expected = slow(data)
+        slow_time = time.perf_counter() - start
+        start = time.perf_counter()
+        result = fast(data)
+        fast_time = time.perf_counter() - start
+        assert result == expected
+        print(f"{name:<15} n={n}: slicing {slow_time:.5f}s, index + trampoline {fast_time:.5f}s")
+
+
+if __name__ == "__main__":
+    print("Sum:", sum_list([1, 2, 3, 4, 5]))
+    print("Max:", find_max([10, 45, 32, 67, 23]))
+    print("Occurrences of 3:", count_occ([1, 3, 2, 3, 4, 3], 3))
+    print("Product:", product_list([2, 3, 4]))
+    print("Length:", str_length("recursion"))
+    print("Reverse:", reverse_string("Python"))
+    print("Palindrome?", is_palindrome("madam"))
+    print()
+    benchmark()
+
+    import time
+    big = list(range(1_000_000))
+    start = time.perf_counter()
+    print("\nsum_list of 1,000,000 numbers:", sum_list(big),
+          f"({time.perf_counter() - start:.2f}s)")
+    word = "a" * 500_000 + "b" + "a" * 500_000
+    start = time.perf_counter()
+    print("is_palindrome of 1,000,001 characters:", is_palindrome(word),
+          f"({time.perf_counter() - start:.2f}s)")
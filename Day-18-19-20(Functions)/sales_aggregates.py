@@ -0,0 +1,163 @@
+"""
+========================================
+  Sales Data Analysis - Live Aggregates
+========================================
+
+Every report in Practices.py Section 10 is recomputed from the full
+sales_data list, and performance_check(sales_by_person(sales_data)) redoes
+the whole aggregation just to print the tiers.
+
+SalesAggregates keeps the results up to date instead:
+- revenue per salesperson
+- quantity per product
+- running total revenue
+- number of transactions
+
+append(transaction) / extend(batch) cost O(1) per record, and the reports
+are O(1) (total, average) or O(groups) (per-person, best product).
+save() / load() store the state as JSON, so a restarted process continues
+where it stopped instead of rescanning the history.
+
+How to use:
+    from sales_aggregates import SalesAggregates
+    agg = SalesAggregates()
+    agg.extend(sales_data)
+    agg.append(("Laptop", 50000, 1, "Rahul"))
+    print(agg.total_revenue(), agg.sales_by_person())
+"""
+import json
+import os
+
+
+class SalesAggregates:
+    def __init__(self):
+        self.person_revenue = {}
+        self.product_qty = {}
+        self.total = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    # ===============================
+    # Updates
+    # ===============================
+
+    # Add one (Product, Price, Quantity, Salesperson) transaction
+    def append(self, transaction):
+        product, price, qty, person = transaction
+        revenue = price * qty
+        self.person_revenue[person] = self.person_revenue.get(person, 0) + revenue
+        self.product_qty[product] = self.product_qty.get(product, 0) + qty
+        self.total += revenue
+        self.count += 1
+
+    # Add a batch of transactions, one by one in row order (float totals
+    # come out the same as appending them separately)
+    def extend(self, batch):
+        for transaction in batch:
+            self.append(transaction)
+
+    # ===============================
+    # Reports
+    # ===============================
+
+    # 1. Total Sales Revenue - O(1)
+    def total_revenue(self):
+        return self.total
+
+    # 2. Best Selling Product - O(products)
+    def best_selling_product(self):
+        best_product = max(self.product_qty, key=self.product_qty.get)
+        return best_product, self.product_qty[best_product]
+
+    # 3. Sales Per Salesperson - O(salespeople)
+    def sales_by_person(self):
+        return dict(self.person_revenue)
+
+    # 4. Average Sales Per Transaction - O(1)
+    def average_sales(self):
+        return self.total / self.count
+
+    # 5. Unique Products Sold - O(products)
+    def unique_products(self):
+        return set(self.product_qty)
+
+    # 9. Conditional Logic (Sales Performance), straight from the stored totals
+    def performance_check(self):
+        for person, revenue in self.person_revenue.items():
+            if revenue > 100000:
+                print(person, "→ Excellent Performance 💯")
+            elif revenue > 50000:
+                print(person, "→ Good Performance 👍")
+            else:
+                print(person, "→ Needs Improvement ⚠️")
+
+    # ===============================
+    # Save / Restore
+    # ===============================
+    def to_dict(self):
+        return {
+            "person_revenue": self.person_revenue,
+            "product_qty": self.product_qty,
+            "total": self.total,
+            "count": self.count,
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        agg = cls()
+        agg.person_revenue = dict(state["person_revenue"])
+        agg.product_qty = dict(state["product_qty"])
+        agg.total = state["total"]
+        agg.count = state["count"]
+        return agg
+
+    # Written to a temporary file first, so a crash never leaves half a file
+    def save(self, path):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    sales_data = [
+        ("Laptop", 50000, 2, "Rahul"),
+        ("Mobile", 15000, 5, "Shalini"),
+        ("Tablet", 20000, 3, "Amit"),
+        ("Laptop", 50000, 1, "Shalini"),
+        ("Headphones", 2000, 10, "Rahul"),
+        ("Charger", 800, 15, "Amit"),
+        ("Mobile", 15000, 2, "Rahul"),
+        ("Laptop", 50000, 1, "Amit"),
+        ("Tablet", 20000, 1, "Shalini"),
+        ("Headphones", 2000, 5, "Rahul")
+    ]
+
+    agg = SalesAggregates()
+    agg.extend(sales_data[:6])
+    for transaction in sales_data[6:]:
+        agg.append(transaction)
+
+    print("1. Total Sales Revenue:", agg.total_revenue())
+    print("2. Best Selling Product:", agg.best_selling_product())
+    print("3. Sales Per Salesperson:", agg.sales_by_person())
+    print("4. Average Sales Per Transaction:", agg.average_sales())
+    print("5. Unique Products Sold:", agg.unique_products())
+    print("\n9. Salesperson Performance:")
+    agg.performance_check()
+
+    # Restart: restore the state instead of rescanning
+    path = os.path.join(tempfile.gettempdir(), "sales_aggregates_demo.json")
+    agg.save(path)
+    restored = SalesAggregates.load(path)
+    print("\nRestored total:", restored.total_revenue(), "over", len(restored), "transactions")
+    os.remove(path)
@@ -0,0 +1,333 @@
+"""
+========================================
+  Sales Data Analysis - Benchmark Suite
+========================================
+
+Measures how the Section 10 reports of Practices.py and the faster engines
+in this folder behave as the data grows.
+
+For every size (10**3 ... 10**8 rows) it:
+1. generates synthetic sales with a fixed seed and a chosen number of
+   products / salespeople (cardinality)
+2. times each report (best of `repeat` runs) and records peak memory
+   (tracemalloc - NumPy allocations are included)
+3. writes everything to a JSON file, so two versions can be compared
+
+Engines:
+- python     → the original row-by-row functions (list of tuples)
+- frame      → SalesFrame, in-memory columns        (sales_frame.py)
+- columnar   → SalesFrame over a memory-mapped file (sales_columnar.py)
+- parallel   → process-pool shards                  (sales_parallel.py)
+- stream     → row-by-row folds over batches        (sales_stream.py)
+- aggregates → SalesAggregates, built then queried  (sales_aggregates.py)
+- hll        → approx_unique_products (HyperLogLog) (sales_hll.py)
+- topk       → exact top-K and Space-Saving sketch  (sales_topk.py)
+- cache      → ReportCache, cold misses and hits    (sales_cache.py)
+
+The list-of-tuples engines need ~150 bytes per row, so they - and any
+report that returns a Python list, like transaction_totals - only run up
+to --max-list-rows; the array-based columnar reports go all the way.
+
+How to use:
+    python sales_benchmark.py --sizes 1000 100000 1000000 --output bench.json
+    python sales_benchmark.py --compare old.json bench.json   # exit code 1 on regression
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+
+from sales_aggregates import SalesAggregates
+from sales_cache import REPORTS, ReportCache, SalesDataset
+from sales_columnar import open_columnar, write_columnar_frame
+from sales_frame import SalesFrame
+from sales_hll import approx_unique_products
+from sales_parallel import parallel_reports
+from sales_stream import best_selling_product_stream, sales_by_person_stream, total_revenue_stream
+from sales_topk import streaming_top_products, top_products
+
+DEFAULT_SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7, 10 ** 8]
+STREAM_BATCH = 100_000
+TOP_K = 10
+
+
+# ===============================
+# Original functions
+# ===============================
+# Copied from Practices.py Section 10 (that file runs all its examples when
+# imported, so it cannot be imported here).
+
+def total_revenue(data):
+    total = 0
+    for product, price, qty, person in data:
+        total += price * qty
+    return total
+
+
+def best_selling_product(data):
+    product_sales = {}
+    for product, price, qty, person in data:
+        product_sales[product] = product_sales.get(product, 0) + qty
+    best_product = max(product_sales, key=product_sales.get)
+    return best_product, product_sales[best_product]
+
+
+def sales_by_person(data):
+    person_sales = {}
+    for product, price, qty, person in data:
+        revenue = price * qty
+        person_sales[person] = person_sales.get(person, 0) + revenue
+    return person_sales
+
+
+def average_sales(data):
+    total = total_revenue(data)
+    return total / len(data)
+
+
+def unique_products(data):
+    return set([product for product, price, qty, person in data])
+
+
+def transaction_totals(data):
+    return list(map(lambda x: x[1] * x[2], data))
+
+
+PYTHON_REPORTS = {
+    "total_revenue": total_revenue,
+    "best_selling_product": best_selling_product,
+    "sales_by_person": sales_by_person,
+    "average_sales": average_sales,
+    "unique_products": unique_products,
+    "transaction_totals": transaction_totals,
+}
+
+# Reports that stay in NumPy arrays; they run at every size.
+# transaction_totals() builds a Python list (~36 bytes per row), so like the
+# list-of-tuples engines it only runs up to --max-list-rows.
+FRAME_REPORTS = ["total_revenue", "best_selling_product", "sales_by_person",
+                 "average_sales", "unique_products", "revenue"]
+FRAME_LIST_REPORTS = ["transaction_totals"]
+
+STREAM_REPORTS = {
+    "total_revenue": total_revenue_stream,
+    "best_selling_product": best_selling_product_stream,
+    "sales_by_person": sales_by_person_stream,
+}
+AGGREGATE_REPORTS = ["total_revenue", "best_selling_product", "sales_by_person",
+                     "average_sales", "unique_products"]
+
+
+# ===============================
+# Synthetic data
+# ===============================
+
+# SalesFrame with n_rows random transactions. Columns are generated with
+# NumPy, so even 10**8 rows only take a few seconds.
+def generate_frame(n_rows, n_products=1000, n_people=50, seed=0):
+    rng = np.random.default_rng(seed)
+    catalog_prices = rng.integers(100, 100_000, size=n_products)
+    product_codes = rng.integers(0, n_products, size=n_rows, dtype=np.int32)
+    return SalesFrame(product_codes,
+                      catalog_prices[product_codes],
+                      rng.integers(1, 21, size=n_rows),
+                      rng.integers(0, n_people, size=n_rows, dtype=np.int32),
+                      [f"Product-{i}" for i in range(n_products)],
+                      [f"Person-{i}" for i in range(n_people)])
+
+
+# A list of transactions in slices of batch_size, like read_sales_batches()
+def list_batches(data, batch_size=STREAM_BATCH):
+    for start in range(0, len(data), batch_size):
+        yield data[start:start + batch_size]
+
+
+# ===============================
+# Measuring
+# ===============================
+
+# Best wall time over `repeat` runs, plus peak traced memory of one run.
+# `setup` builds fresh input for every run so caches don't skew the timing.
+def measure(func, setup=None, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        arg = setup() if setup else None
+        start = time.perf_counter()
+        func(arg) if setup else func()
+        best = min(best, time.perf_counter() - start)
+    arg = setup() if setup else None
+    tracemalloc.start()
+    func(arg) if setup else func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def fresh_frame(frame):
+    return SalesFrame(frame.product_codes, frame.price, frame.qty, frame.person_codes,
+                      frame.product_names, frame.person_names, frame.chunk_size)
+
+
+def run_size(n_rows, n_products, n_people, repeat, max_list_rows, seed, workers):
+    results = []
+
+    def record(engine, report, seconds, peak):
+        results.append({"rows": n_rows, "products": n_products, "people": n_people,
+                        "engine": engine, "report": report,
+                        "seconds": seconds, "peak_bytes": peak})
+        print(f"{n_rows:>11} {engine:>10} {report:<22} {seconds:>10.4f}s {peak / 2**20:>9.1f} MB")
+
+    frame = generate_frame(n_rows, n_products, n_people, seed)
+
+    # In-memory columns
+    for report in FRAME_REPORTS:
+        seconds, peak = measure(lambda f, r=report: getattr(f, r)(),
+                                lambda: fresh_frame(frame), repeat)
+        record("frame", report, seconds, peak)
+
+    # Memory-mapped columnar file
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.salescol")
+        write_columnar_frame(path, frame)
+        for report in ["total_revenue", "best_selling_product", "sales_by_person"]:
+            seconds, peak = measure(lambda f, r=report: getattr(f, r)(),
+                                    lambda: open_columnar(path), repeat)
+            record("columnar", report, seconds, peak)
+
+    seconds, peak = measure(lambda f: top_products(f, TOP_K), lambda: fresh_frame(frame), repeat)
+    record("topk", "top_products", seconds, peak)
+
+    # List-of-tuples engines and list-building reports
+    if n_rows <= max_list_rows:
+        for report in FRAME_LIST_REPORTS:
+            seconds, peak = measure(lambda f, r=report: getattr(f, r)(),
+                                    lambda: fresh_frame(frame), repeat)
+            record("frame", report, seconds, peak)
+        data = frame.to_records()
+        for report, func in PYTHON_REPORTS.items():
+            seconds, peak = measure(lambda f=func: f(data), repeat=repeat)
+            record("python", report, seconds, peak)
+        seconds, peak = measure(lambda: SalesFrame.from_records(data), repeat=repeat)
+        record("frame", "from_records", seconds, peak)
+        seconds, peak = measure(lambda: parallel_reports(data, workers), repeat=repeat)
+        record("parallel", "sales_by_person+best", seconds, peak)
+        run_list_engines(data, repeat, record)
+    return results
+
+
+# Engines that take a list of tuples (or batches of it)
+def run_list_engines(data, repeat, record):
+    for report, func in STREAM_REPORTS.items():
+        seconds, peak = measure(lambda f=func: f(list_batches(data)), repeat=repeat)
+        record("stream", report, seconds, peak)
+
+    seconds, peak = measure(lambda: SalesAggregates().extend(data), repeat=repeat)
+    record("aggregates", "extend", seconds, peak)
+    aggregates = SalesAggregates()
+    aggregates.extend(data)
+    for report in AGGREGATE_REPORTS:
+        seconds, peak = measure(lambda r=report: getattr(aggregates, r)(), repeat=repeat)
+        record("aggregates", report, seconds, peak)
+
+    seconds, peak = measure(lambda: approx_unique_products(data), repeat=repeat)
+    record("hll", "approx_unique_products", seconds, peak)
+
+    seconds, peak = measure(lambda: streaming_top_products(list_batches(data), TOP_K),
+                            repeat=repeat)
+    record("topk", "streaming_top_products", seconds, peak)
+
+    # Cache: building the fingerprinted dataset, all reports on a cold
+    # cache (one shared SalesFrame), then all reports again as hits
+    seconds, peak = measure(lambda: SalesDataset(data), repeat=repeat)
+    record("cache", "dataset", seconds, peak)
+    dataset = SalesDataset(data)
+
+    def run_all(cache):
+        for name, report in REPORTS.items():
+            cache.memoize(report, name)(dataset)
+        return cache
+
+    seconds, peak = measure(run_all, ReportCache, repeat)
+    record("cache", "all_reports_cold", seconds, peak)
+    warm = run_all(ReportCache())
+    seconds, peak = measure(lambda: run_all(warm), repeat=repeat)
+    record("cache", "all_reports_hit", seconds, peak)
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, n_products=1000, n_people=50, repeat=3,
+                   max_list_rows=10 ** 6, seed=0, workers=None, output=None):
+    print(f"{'rows':>11} {'engine':>10} {'report':<22} {'time':>11} {'peak mem':>12}")
+    results = []
+    for n_rows in sizes:
+        results.extend(run_size(n_rows, n_products, n_people, repeat,
+                                max_list_rows, seed, workers))
+    report = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.platform(),
+            "cpus": os.cpu_count(),
+            "seed": seed,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults saved to {output}")
+    return report
+
+
+# ===============================
+# Regression check
+# ===============================
+
+# Print every (rows, engine, report) that got slower than `threshold` times
+# the old run. Returns the list of regressions (the command line exits with
+# status 1 if it is not empty, so CI can fail on it).
+def compare(old_path, new_path, threshold=1.2):
+    def load(path):
+        with open(path, encoding="utf-8") as f:
+            return {(r["rows"], r["products"], r["people"], r["engine"], r["report"]): r
+                    for r in json.load(f)["results"]}
+
+    old, new = load(old_path), load(new_path)
+    regressions = []
+    for key in sorted(old.keys() & new.keys()):
+        ratio = new[key]["seconds"] / max(old[key]["seconds"], 1e-9)
+        if ratio > threshold:
+            regressions.append((key, ratio))
+            print(f"SLOWER x{ratio:.2f}: rows={key[0]} engine={key[3]} report={key[4]}")
+    if not regressions:
+        print("No regressions above", threshold)
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the sales reports")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--products", type=int, default=1000, help="distinct products")
+    parser.add_argument("--people", type=int, default=50, help="distinct salespeople")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-list-rows", type=int, default=10 ** 6)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="sales_benchmark.json")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"))
+    parser.add_argument("--threshold", type=float, default=1.2)
+    args = parser.parse_args()
+
+    if args.compare:
+        sys.exit(1 if compare(*args.compare, threshold=args.threshold) else 0)
+    else:
+        run_benchmarks(args.sizes, args.products, args.people, args.repeat,
+                       args.max_list_rows, args.seed, args.workers, args.output)
@@ -0,0 +1,210 @@
+"""
+========================================
+  Sales Data Analysis - Report Cache
+========================================
+
+A service asks for the same sales reports again and again while the data
+has not changed. ReportCache remembers report results:
+
+    key = (report name, dataset fingerprint, report parameters)
+
+1. SalesDataset
+   A list of transactions that keeps a rolling 64-bit hash of its contents.
+   append()/extend() update the hash in O(1) per record, so the
+   fingerprint is always ready without rescanning the data.
+
+2. ReportCache
+   LRU cache (collections.OrderedDict) with a budget on entries and on the
+   approximate size of the stored results. Appending transactions changes
+   the fingerprint, so results for the old contents can never be returned
+   again - they just age out of the LRU.
+
+   On a miss the report runs on a SalesFrame. The frame is built once per
+   fingerprint and shared by every report, so five cold reports cost one
+   conversion, not five. The last few frames are kept (max_frames); they
+   are not counted in max_bytes.
+
+Only SalesDataset can be cached: a plain list has no fingerprint, and
+hashing it on every call would cost as much as running the report.
+
+How to use:
+    from sales_cache import SalesDataset, ReportCache, REPORTS
+    cache = ReportCache(max_entries=256, max_bytes=50 * 2**20)
+    total_revenue = cache.memoize(REPORTS["total_revenue"], "total_revenue")
+    # REPORTS[...] take a SalesFrame; the cache builds it from the dataset
+    data = SalesDataset(sales_data)
+    total_revenue(data)   # computed
+    total_revenue(data)   # O(1) - from the cache
+    data.append(("Laptop", 50000, 1, "Rahul"))
+    total_revenue(data)   # recomputed for the new contents
+"""
+import copy
+import pickle
+from collections import OrderedDict
+from functools import wraps
+
+from sales_frame import SalesFrame
+from sales_hll import hash64
+
+MASK64 = (1 << 64) - 1
+MULTIPLIER = 0x100000001B3  # FNV-1a 64-bit prime
+
+
+# ===============================
+# Dataset with a rolling fingerprint
+# ===============================
+class SalesDataset:
+    def __init__(self, data=()):
+        self.data = []
+        self.hash = 0
+        self.extend(data)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __getitem__(self, index):
+        return self.data[index]
+
+    # hash = hash * P + hash64(transaction): O(1) per record and depends on
+    # the order of the transactions.
+    def append(self, transaction):
+        transaction = tuple(transaction)
+        self.data.append(transaction)
+        self.hash = (self.hash * MULTIPLIER + hash64(transaction)) & MASK64
+
+    def extend(self, transactions):
+        for transaction in transactions:
+            self.append(transaction)
+
+    def fingerprint(self):
+        return len(self.data), self.hash
+
+
+# Fingerprint of a dataset. Lists are refused: hashing them on every call
+# is O(n) - wrap the data in a SalesDataset once instead.
+def fingerprint(data):
+    if not isinstance(data, SalesDataset):
+        raise TypeError(f"ReportCache needs a SalesDataset, not {type(data).__name__}")
+    return data.fingerprint()
+
+
+# ===============================
+# LRU cache
+# ===============================
+
+# Rough size of a cached result in bytes
+def result_size(result):
+    try:
+        return len(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+    except (pickle.PicklingError, TypeError):
+        return 0
+
+
+class ReportCache:
+    def __init__(self, max_entries=256, max_bytes=64 * 2 ** 20, max_frames=2):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_frames = max_frames
+        self.entries = OrderedDict()   # key → (result, size)
+        self.frames = OrderedDict()    # fingerprint → SalesFrame
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return True, self.entries[key][0]
+        self.misses += 1
+        return False, None
+
+    def put(self, key, result):
+        size = result_size(result)
+        if size > self.max_bytes:
+            return  # bigger than the whole budget - don't cache
+        if key in self.entries:
+            self.total_bytes -= self.entries.pop(key)[1]
+        self.entries[key] = (result, size)
+        self.total_bytes += size
+        while len(self.entries) > self.max_entries or self.total_bytes > self.max_bytes:
+            _, (_, old_size) = self.entries.popitem(last=False)
+            self.total_bytes -= old_size
+
+    def clear(self):
+        self.entries.clear()
+        self.frames.clear()
+        self.total_bytes = 0
+
+    # The SalesFrame for this dataset contents, built on first use
+    def frame(self, data, key):
+        if key in self.frames:
+            self.frames.move_to_end(key)
+            return self.frames[key]
+        frame = SalesFrame.from_records(data)
+        self.frames[key] = frame
+        while len(self.frames) > self.max_frames:
+            self.frames.popitem(last=False)
+        return frame
+
+    # Wrap report(frame, *args, **kwargs) into cached(dataset, *args, **kwargs):
+    # repeated calls on an unchanged SalesDataset come from the cache.
+    # Results are copied on the way out so a caller changing the returned
+    # dict can't corrupt the cache.
+    def memoize(self, report, name=None):
+        name = name or report.__name__
+
+        @wraps(report)
+        def cached(data, *args, **kwargs):
+            data_key = fingerprint(data)
+            key = (name, data_key, args, tuple(sorted(kwargs.items())))
+            found, result = self.get(key)
+            if not found:
+                result = report(self.frame(data, data_key), *args, **kwargs)
+                self.put(key, result)
+            return copy.copy(result)
+
+        return cached
+
+
+# ===============================
+# Section 10 reports (on a SalesFrame)
+# ===============================
+REPORTS = {
+    "total_revenue": SalesFrame.total_revenue,
+    "best_selling_product": SalesFrame.best_selling_product,
+    "sales_by_person": SalesFrame.sales_by_person,
+    "average_sales": SalesFrame.average_sales,
+    "unique_products": SalesFrame.unique_products,
+}
+
+
+if __name__ == "__main__":
+    sales_data = [
+        ("Laptop", 50000, 2, "Rahul"),
+        ("Mobile", 15000, 5, "Shalini"),
+        ("Tablet", 20000, 3, "Amit"),
+        ("Laptop", 50000, 1, "Shalini"),
+        ("Headphones", 2000, 10, "Rahul"),
+        ("Charger", 800, 15, "Amit"),
+        ("Mobile", 15000, 2, "Rahul"),
+        ("Laptop", 50000, 1, "Amit"),
+        ("Tablet", 20000, 1, "Shalini"),
+        ("Headphones", 2000, 5, "Rahul")
+    ]
+
+    cache = ReportCache(max_entries=16)
+    reports = {name: cache.memoize(func, name) for name, func in REPORTS.items()}
+
+    data = SalesDataset(sales_data)
+    print("Total revenue:", reports["total_revenue"](data))
+    print("Total revenue:", reports["total_revenue"](data), "(cached)")
+    data.append(("Laptop", 50000, 1, "Rahul"))
+    print("Total revenue after append:", reports["total_revenue"](data))
+    print("Hits:", cache.hits, "Misses:", cache.misses)
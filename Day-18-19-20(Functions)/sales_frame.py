@@ -0,0 +1,256 @@
+"""
+========================================
+  Sales Data Analysis - Columnar Engine
+========================================
+
+The Section 10 functions in Practices.py (total_revenue, best_selling_product,
+sales_by_person, average_sales, unique_products) each loop over the whole
+list of (Product, Price, Quantity, Salesperson) tuples again.
+
+SalesFrame stores the same transactions as columns instead of rows:
+- price, quantity      → NumPy number arrays
+- product, salesperson → dictionary-encoded (small int codes + list of names)
+
+All reports are then produced together from ONE vectorized pass:
+- revenue per row      → price * quantity
+- group-by product     → np.bincount(product_codes, weights=quantity)
+- group-by salesperson → np.bincount(person_codes, weights=revenue)
+Integer revenues or sums that could pass the int64 range (2**63) are
+computed with Python ints instead, so they never wrap around.
+
+Results are identical to the original functions (same values, same
+dictionary order, same tie-breaking). Float columns are summed in row
+order, as the original loops do, also when a memory-mapped frame is
+aggregated chunk by chunk.
+
+How to use:
+    from sales_frame import SalesFrame
+    frame = SalesFrame.from_records(sales_data)
+    print(frame.total_revenue(), frame.sales_by_person())
+"""
+import numpy as np
+
+AGGREGATES = ("total", "product_qty", "person_revenue")
+SUM_BLOCK = 1 << 20     # rows per np.cumsum block in exact_sum()
+
+
+# ===============================
+# Helpers
+# ===============================
+
+# Dictionary-encode a sequence of names.
+# Codes follow first-appearance order, same as the insertion order of the
+# dictionaries built by the original row-by-row functions.
+def encode(values, index=None):
+    if index is None:
+        index = {}
+    codes = [index.setdefault(value, len(index)) for value in values]
+    return np.array(codes, dtype=np.int32), index
+
+
+# price * qty per row. int64 wraps around silently past 2**63, so integer
+# columns whose product could get that big are multiplied as Python ints.
+def multiply(price, qty):
+    if price.dtype.kind in "iu" and qty.dtype.kind in "iu" and len(price):
+        largest = (max(abs(int(price.min())), abs(int(price.max())))
+                   * max(abs(int(qty.min())), abs(int(qty.max()))))
+        if largest >= 2 ** 63:
+            return price.astype(object) * qty.astype(object)
+    return price * qty
+
+
+# start + sum of `values`, added in row order like the original loop.
+# Integer sums that could leave int64 use Python ints. Float sums use
+# np.cumsum (strictly left to right) instead of values.sum(), whose
+# pairwise summation can differ from the loop in the last bits.
+def exact_sum(values, start=0):
+    if values.dtype.kind in "iuO":
+        if values.dtype.kind == "O" or np.abs(values).sum(dtype=np.float64) >= 2 ** 62:
+            return sum(values.tolist(), start)
+        return start + to_python(values.sum())
+    for block_start in range(0, len(values), SUM_BLOCK):
+        block = values[block_start:block_start + SUM_BLOCK]
+        start = to_python(np.cumsum(np.concatenate(([start], block)))[-1])
+    return start
+
+
+# Sum `values` per group code, on top of the running sums `initial`.
+# np.bincount always accumulates in float64; that is exact for integers as
+# long as every partial sum stays below 2**53, which sum(|values|) bounds.
+# Past 2**62 even int64 could overflow, so the sums are kept as Python ints.
+# Float sums are added in row order: the running sums go in first, as
+# extra rows, so chunk after chunk gives the same result as one pass.
+def group_sum(codes, values, n_groups, initial=None):
+    if values.dtype.kind in "iuO":
+        if values.dtype.kind == "O":
+            bound = float("inf")
+        else:
+            bound = np.abs(values).sum(dtype=np.float64)
+        if bound < 2 ** 53:
+            sums = np.bincount(codes, weights=values, minlength=n_groups).astype(np.int64)
+        elif bound < 2 ** 62:
+            sums = np.zeros(n_groups, dtype=np.int64)
+            np.add.at(sums, codes, values.astype(np.int64))
+        else:
+            sums = np.zeros(n_groups, dtype=object)
+            for code, value in zip(codes.tolist(), values.tolist()):
+                sums[code] += value
+        return sums if initial is None else add_sums(initial, sums)
+    if initial is None:
+        return np.bincount(codes, weights=values, minlength=n_groups)
+    return np.bincount(np.concatenate((np.arange(n_groups), codes)),
+                       weights=np.concatenate((initial, values)), minlength=n_groups)
+
+
+# Add the group sums of one chunk to the running ones without int64 overflow
+def add_sums(running, partial):
+    if running.dtype.kind in "iu" and partial.dtype.kind in "iu" and len(running):
+        largest = np.abs(running).max(initial=0) + np.abs(partial).max(initial=0)
+        if float(largest) >= 2 ** 62:
+            return running.astype(object) + partial.astype(object)
+    return running + partial
+
+
+# Convert a NumPy scalar into the matching plain Python number.
+def to_python(value):
+    return value.item() if hasattr(value, "item") else value
+
+
+# ===============================
+# SalesFrame
+# ===============================
+class SalesFrame:
+    # chunk_size=None → columns are in memory, aggregate them in one go.
+    # chunk_size=N      → aggregate N rows at a time (used for memory-mapped
+    #                     columns, so a report never needs the whole file in RAM).
+    def __init__(self, product_codes, price, qty, person_codes,
+                 product_names, person_names, chunk_size=None):
+        self.product_codes = np.asarray(product_codes)
+        self.price = np.asarray(price)
+        self.qty = np.asarray(qty)
+        self.person_codes = np.asarray(person_codes)
+        self.product_names = list(product_names)
+        self.person_names = list(person_names)
+        self.chunk_size = chunk_size
+        self._summary = {}
+
+    # Build a frame from the list-of-tuples layout used in Practices.py
+    @classmethod
+    def from_records(cls, data):
+        data = list(data)
+        if not data:
+            return cls(np.array([], dtype=np.int32), np.array([], dtype=np.int64),
+                       np.array([], dtype=np.int64), np.array([], dtype=np.int32), [], [])
+        products, prices, qtys, persons = zip(*data)
+        product_codes, product_index = encode(products)
+        person_codes, person_index = encode(persons)
+        return cls(product_codes, np.array(prices), np.array(qtys), person_codes,
+                   product_index, person_index)
+
+    def __len__(self):
+        return len(self.qty)
+
+    # Back to the original tuple layout
+    def to_records(self):
+        return [(self.product_names[p], to_python(price), to_python(qty), self.person_names[s])
+                for p, price, qty, s in zip(self.product_codes, self.price,
+                                             self.qty, self.person_codes)]
+
+    # ===============================
+    # The single vectorized pass
+    # ===============================
+    # Every report reads from this cached summary, so the columns are scanned
+    # once no matter how many reports are asked for. In-memory frames compute
+    # every aggregate in that one pass; chunked (memory-mapped) frames compute
+    # only the ones asked for, so only the columns they need are paged in.
+    def summary(self, keys=AGGREGATES):
+        missing = [key for key in keys if key not in self._summary]
+        if not missing:
+            return self._summary
+        if self.chunk_size is None:
+            missing = AGGREGATES
+        n = len(self)
+        step = self.chunk_size or max(n, 1)
+        total = 0
+        product_qty = np.zeros(len(self.product_names), dtype=np.int64)
+        person_revenue = np.zeros(len(self.person_names), dtype=np.int64)
+        for start in range(0, n, step):
+            stop = start + step
+            if "product_qty" in missing:
+                product_qty = group_sum(self.product_codes[start:stop], self.qty[start:stop],
+                                        len(self.product_names), product_qty)
+            if "total" in missing or "person_revenue" in missing:
+                revenue = multiply(self.price[start:stop], self.qty[start:stop])
+                total = exact_sum(revenue, total)
+                if "person_revenue" in missing:
+                    person_revenue = group_sum(self.person_codes[start:stop], revenue,
+                                               len(self.person_names), person_revenue)
+        computed = {"total": total, "product_qty": product_qty,
+                    "person_revenue": person_revenue}
+        for key in missing:
+            self._summary[key] = computed[key]
+        return self._summary
+
+    # Revenue of every transaction (price * quantity)
+    def revenue(self):
+        return multiply(self.price, self.qty)
+
+    # 1. Total Sales Revenue
+    def total_revenue(self):
+        return self.summary(["total"])["total"]
+
+    # 2. Best Selling Product
+    # np.argmax returns the first maximum, which matches max() over a dict
+    # built in first-appearance order.
+    def best_selling_product(self):
+        product_qty = self.summary(["product_qty"])["product_qty"]
+        if len(product_qty) == 0:
+            raise ValueError("best_selling_product() arg is an empty sequence")
+        best = int(np.argmax(product_qty))
+        return self.product_names[best], to_python(product_qty[best])
+
+    # Quantity sold per product (the dict best_selling_product takes max() of)
+    def sales_by_product(self):
+        product_qty = self.summary(["product_qty"])["product_qty"].tolist()
+        return dict(zip(self.product_names, product_qty))
+
+    # 3. Sales Per Salesperson
+    def sales_by_person(self):
+        person_revenue = self.summary(["person_revenue"])["person_revenue"].tolist()
+        return dict(zip(self.person_names, person_revenue))
+
+    # 4. Average Sales Per Transaction
+    def average_sales(self):
+        return self.total_revenue() / len(self)
+
+    # 5. Unique Products Sold
+    def unique_products(self):
+        return set(self.product_names)
+
+    # 6. Total per transaction
+    def transaction_totals(self):
+        return self.revenue().tolist()
+
+
+if __name__ == "__main__":
+    sales_data = [
+        ("Laptop", 50000, 2, "Rahul"),
+        ("Mobile", 15000, 5, "Shalini"),
+        ("Tablet", 20000, 3, "Amit"),
+        ("Laptop", 50000, 1, "Shalini"),
+        ("Headphones", 2000, 10, "Rahul"),
+        ("Charger", 800, 15, "Amit"),
+        ("Mobile", 15000, 2, "Rahul"),
+        ("Laptop", 50000, 1, "Amit"),
+        ("Tablet", 20000, 1, "Shalini"),
+        ("Headphones", 2000, 5, "Rahul")
+    ]
+
+    frame = SalesFrame.from_records(sales_data)
+    print("1. Total Sales Revenue:", frame.total_revenue())
+    best_product, qty = frame.best_selling_product()
+    print("2. Best Selling Product:", best_product, "with", qty, "units")
+    print("3. Sales Per Salesperson:", frame.sales_by_person())
+    print("4. Average Sales Per Transaction:", frame.average_sales())
+    print("5. Unique Products Sold:", frame.unique_products())
+    print("6. Transaction Totals:", frame.transaction_totals())
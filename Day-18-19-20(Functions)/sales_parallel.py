@@ -0,0 +1,219 @@
+"""
+========================================
+  Sales Data Analysis - Multi-core Mode
+========================================
+
+sales_by_person and best_selling_product in Practices.py run on one core.
+Here the rows are split into contiguous shards, every shard is aggregated
+in a separate process (ProcessPoolExecutor), and the partial sums are
+merged back together.
+
+What is sent to a worker matters more than the work itself: pickling a
+list of tuples costs more than aggregating it. So the workers get
+columns, never tuples:
+- a SalesFrame   → NumPy column slices (pickled as flat buffers)
+- a .salescol file (sales_columnar.py) → just (path, start, stop); each
+  worker memory-maps its own rows, nothing is copied between processes
+
+Steps:
+1. split_ranges()     → N contiguous (start, stop) row ranges
+2. shard_partial()    → per shard: total, qty per product code,
+                        revenue per person code (NumPy arrays)
+3. merge_partials()   → partials added shard by shard, in row order
+
+Names come from the frame's dictionaries (first-appearance order), so
+dictionary order and max() tie-breaking are the same as the single-core
+functions. Integer sales give identical sums. With float prices each
+shard is summed on its own; float addition is not associative, so the
+last bits can differ from the single-core loop (the merge order is
+fixed, so the result is the same on every run).
+
+How to use:
+    from sales_parallel import sales_by_person_parallel
+    frame = SalesFrame.from_records(sales_data)
+    print(sales_by_person_parallel(frame, workers=4))
+    print(sales_by_person_parallel("sales.salescol", workers=4))
+
+Run this file directly to compare 1 → N cores with the original
+single-core functions.
+"""
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from sales_columnar import map_column, read_header
+from sales_frame import SalesFrame, exact_sum, group_sum, multiply
+
+
+# ===============================
+# Sharding
+# ===============================
+
+# Cut n_rows into n_shards contiguous (start, stop) ranges of (almost) equal size.
+def split_ranges(n_rows, n_shards):
+    n_shards = max(1, min(n_shards, n_rows))
+    size, extra = divmod(n_rows, n_shards)
+    ranges = []
+    start = 0
+    for i in range(n_shards):
+        stop = start + size + (1 if i < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+# Work done inside each worker: (total, product_qty, person_revenue) of one
+# shard, indexed by the frame-wide product / person codes.
+def shard_partial(product_codes, price, qty, person_codes, n_products, n_people):
+    revenue = multiply(price, qty)
+    return (exact_sum(revenue),
+            group_sum(product_codes, qty, n_products),
+            group_sum(person_codes, revenue, n_people))
+
+
+# Worker for a columnar file: map only rows start..stop of each column
+def file_partial(path, start, stop):
+    header = read_header(path)
+    columns = [map_column(path, header, name)[start:stop]
+               for name in ("product", "price", "quantity", "person")]
+    return shard_partial(*columns, len(header["products"]), len(header["salespeople"]))
+
+
+# Add the partials up shard by shard - the order rows appear in.
+def merge_partials(partials, n_products, n_people):
+    total = exact_sum(np.array([partial[0] for partial in partials]))
+    product_qty = np.zeros(n_products, dtype=np.int64)
+    person_revenue = np.zeros(n_people, dtype=np.int64)
+    for _, qty, revenue in partials:
+        product_qty = group_sum(np.arange(n_products), qty, n_products, product_qty)
+        person_revenue = group_sum(np.arange(n_people), revenue, n_people, person_revenue)
+    return total, product_qty, person_revenue
+
+
+# ===============================
+# Parallel reports
+# ===============================
+
+# (total, {product: qty}, {person: revenue}) using `workers` processes.
+# source: a SalesFrame, a .salescol path, or a list of tuples (converted to
+# a SalesFrame first - that conversion is the slow part, convert once and
+# pass the frame if several reports are needed).
+# shards defaults to one per worker; workers=1 runs in-process.
+def parallel_summary(source, workers=None, shards=None):
+    workers = workers or os.cpu_count() or 1
+    shards = shards or workers
+
+    if isinstance(source, (str, os.PathLike)):
+        header = read_header(source)
+        product_names, person_names = header["products"], header["salespeople"]
+        jobs = [(file_partial, (source, start, stop))
+                for start, stop in split_ranges(header["rows"], shards)]
+    else:
+        frame = source if isinstance(source, SalesFrame) else SalesFrame.from_records(source)
+        product_names, person_names = frame.product_names, frame.person_names
+        jobs = [(shard_partial, (frame.product_codes[start:stop], frame.price[start:stop],
+                                 frame.qty[start:stop], frame.person_codes[start:stop],
+                                 len(product_names), len(person_names)))
+                for start, stop in split_ranges(len(frame), shards)]
+
+    if workers == 1:
+        partials = [func(*args) for func, args in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(func, *args) for func, args in jobs]
+            partials = [future.result() for future in futures]
+
+    total, product_qty, person_revenue = merge_partials(partials, len(product_names),
+                                                        len(person_names))
+    return (total, dict(zip(product_names, product_qty.tolist())),
+            dict(zip(person_names, person_revenue.tolist())))
+
+
+# ({product: qty}, {person: revenue})
+def parallel_reports(source, workers=None, shards=None):
+    _, product_sales, person_sales = parallel_summary(source, workers, shards)
+    return product_sales, person_sales
+
+
+# 1. Total Sales Revenue
+def total_revenue_parallel(source, workers=None, shards=None):
+    return parallel_summary(source, workers, shards)[0]
+
+
+# 2. Best Selling Product
+def best_selling_product_parallel(source, workers=None, shards=None):
+    product_sales, _ = parallel_reports(source, workers, shards)
+    best_product = max(product_sales, key=product_sales.get)
+    return best_product, product_sales[best_product]
+
+
+# 3. Sales Per Salesperson
+def sales_by_person_parallel(source, workers=None, shards=None):
+    _, person_sales = parallel_reports(source, workers, shards)
+    return person_sales
+
+
+# ===============================
+# Benchmark
+# ===============================
+
+# Random transactions in the sales_data layout.
+def generate_sales(n_rows, n_products=1000, n_people=50, seed=0):
+    rnd = random.Random(seed)
+    products = [f"Product-{i}" for i in range(n_products)]
+    people = [f"Person-{i}" for i in range(n_people)]
+    prices = [rnd.randint(100, 100_000) for _ in range(n_products)]
+    data = []
+    for _ in range(n_rows):
+        p = rnd.randrange(n_products)
+        data.append((products[p], prices[p], rnd.randint(1, 20), rnd.choice(people)))
+    return data
+
+
+def best_time(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+# Time the original single-core sales_by_person + best_selling_product
+# against parallel_reports on an in-memory frame and on a columnar file,
+# for 1, 2, 4, ... max_workers cores. Speed-ups are relative to the originals.
+def benchmark_scaling(n_rows=2_000_000, max_workers=None, repeat=3):
+    import tempfile
+
+    from sales_benchmark import best_selling_product, sales_by_person
+    from sales_columnar import write_columnar
+
+    max_workers = max_workers or os.cpu_count() or 1
+    data = generate_sales(n_rows)
+    frame = SalesFrame.from_records(data)
+    counts = sorted({1, max_workers} | {2 ** i for i in range(max_workers.bit_length())
+                                        if 2 ** i <= max_workers})
+
+    base, _ = best_time(lambda: (sales_by_person(data), best_selling_product(data)), repeat)
+    expected = (dict(frame.sales_by_product()), sales_by_person(data))
+    rows = [("original", 1, base)]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.salescol")
+        write_columnar(path, data)
+        for workers in counts:
+            for engine, source in (("frame", frame), ("columnar", path)):
+                seconds, got = best_time(lambda: parallel_reports(source, workers), repeat)
+                assert got == expected
+                rows.append((engine, workers, seconds))
+
+    print(f"{'engine':>9} {'workers':>8} {'seconds':>10} {'speedup':>8}")
+    for engine, workers, seconds in rows:
+        print(f"{engine:>9} {workers:>8} {seconds:>10.3f} {base / seconds:>7.2f}x")
+    return rows
+
+
+if __name__ == "__main__":
+    benchmark_scaling()
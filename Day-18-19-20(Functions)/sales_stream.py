@@ -0,0 +1,134 @@
+"""
+========================================
+  Sales Data Analysis - Streaming CSV
+========================================
+
+The Section 10 functions in Practices.py need the whole sales_data list in
+memory. Real transaction exports are CSV files far bigger than RAM.
+
+This module reads such a CSV in fixed-size batches and folds every batch
+into a small running result, so peak memory is ONE batch no matter how big
+the file is.
+
+CSV layout (same order as the sales_data tuples):
+    Product,Price,Quantity,Salesperson
+    Laptop,50000,2,Rahul
+    ...
+
+How to use:
+    from sales_stream import read_sales_batches, total_revenue_stream
+    print(total_revenue_stream(read_sales_batches("sales.csv")))
+"""
+import csv
+from itertools import islice
+
+HEADER = ["Product", "Price", "Quantity", "Salesperson"]
+
+
+# ===============================
+# Reading
+# ===============================
+
+# "50000" → 50000, "499.5" → 499.5
+def parse_number(text):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+# Yield lists of (Product, Price, Quantity, Salesperson) tuples, each with at
+# most `batch_size` rows. Only the current batch is ever held in memory.
+def read_sales_batches(path, batch_size=100_000, header=True):
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        if header:
+            next(reader, None)
+        while True:
+            rows = list(islice(reader, batch_size))
+            if not rows:
+                return
+            yield [(product, parse_number(price), parse_number(qty), person)
+                   for product, price, qty, person in rows]
+
+
+# Write transactions in the layout read_sales_batches expects.
+def write_sales_csv(path, data, header=True):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        if header:
+            writer.writerow(HEADER)
+        writer.writerows(data)
+
+
+# ===============================
+# Incremental reports
+# ===============================
+# Each fold keeps only a running total / small dictionary between batches
+# and adds every row to it directly, in file order. That is the original
+# loop, so results match it exactly (float sums too), and it is faster
+# than building a SalesFrame per batch - the rows are Python tuples
+# already, converting them to arrays costs more than adding them up.
+
+# Merge the per-group sums of one batch into the running dictionary.
+def merge_counts(running, partial):
+    for key, value in partial.items():
+        running[key] = running.get(key, 0) + value
+    return running
+
+
+# 1. Total Sales Revenue
+def total_revenue_stream(batches):
+    total = 0
+    for batch in batches:
+        for product, price, qty, person in batch:
+            total += price * qty
+    return total
+
+
+# 2. Best Selling Product
+def best_selling_product_stream(batches):
+    product_sales = {}
+    for batch in batches:
+        for product, price, qty, person in batch:
+            product_sales[product] = product_sales.get(product, 0) + qty
+    best_product = max(product_sales, key=product_sales.get)
+    return best_product, product_sales[best_product]
+
+
+# 3. Sales Per Salesperson
+def sales_by_person_stream(batches):
+    person_sales = {}
+    for batch in batches:
+        for product, price, qty, person in batch:
+            person_sales[person] = person_sales.get(person, 0) + price * qty
+    return person_sales
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    sales_data = [
+        ("Laptop", 50000, 2, "Rahul"),
+        ("Mobile", 15000, 5, "Shalini"),
+        ("Tablet", 20000, 3, "Amit"),
+        ("Laptop", 50000, 1, "Shalini"),
+        ("Headphones", 2000, 10, "Rahul"),
+        ("Charger", 800, 15, "Amit"),
+        ("Mobile", 15000, 2, "Rahul"),
+        ("Laptop", 50000, 1, "Amit"),
+        ("Tablet", 20000, 1, "Shalini"),
+        ("Headphones", 2000, 5, "Rahul")
+    ]
+
+    path = os.path.join(tempfile.gettempdir(), "sales_stream_demo.csv")
+    write_sales_csv(path, sales_data)
+
+    # batch_size=3 → the 10 rows arrive as batches of 3, 3, 3, 1
+    print("1. Total Sales Revenue:", total_revenue_stream(read_sales_batches(path, 3)))
+    print("2. Best Selling Product:", best_selling_product_stream(read_sales_batches(path, 3)))
+    print("3. Sales Per Salesperson:", sales_by_person_stream(read_sales_batches(path, 3)))
+    os.remove(path)
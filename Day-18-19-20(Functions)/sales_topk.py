@@ -0,0 +1,186 @@
+"""
+========================================
+  Sales Data Analysis - Top-K Reports
+========================================
+
+best_selling_product in Practices.py builds the full product → quantity
+dictionary and calls max(), so it can only answer "who is number 1".
+Dashboards want the top K products / salespeople, by quantity or revenue.
+
+1. Exact top-K (bounded heap)
+   top_k() keeps a heap of at most K entries while scanning the groups
+   (heapq.nlargest), so it costs O(groups * log K) instead of a full sort.
+   top_k(counts, 1) gives the same answer as max(counts, key=counts.get).
+
+2. Approximate top-K over a stream (Space-Saving sketch)
+   SpaceSaving keeps at most `capacity` counters - O(K) memory however many
+   distinct products the stream has. Every reported count is an upper bound
+   and over-estimates the true count by at most total_weight / capacity, so
+   any item heavier than that is guaranteed to be in the sketch. Sketches of
+   different shards can be merged; the merged bound is the sum of theirs.
+
+How to use:
+    from sales_topk import top_products, SpaceSaving
+    print(top_products(sales_data, k=3, by="revenue"))
+"""
+import heapq
+
+from sales_frame import SalesFrame, group_sum
+
+VALID_BY = ("quantity", "revenue")
+
+
+# ===============================
+# Exact top-K
+# ===============================
+
+# K largest (key, value) pairs of a dictionary, largest first.
+# Equal values keep dictionary order, like max().
+def top_k(counts, k):
+    return heapq.nlargest(k, counts.items(), key=lambda item: item[1])
+
+
+# {group name: total} for products or salespeople, by quantity or revenue.
+def group_totals(frame, group, by):
+    if by not in VALID_BY:
+        raise ValueError(f"by must be one of {VALID_BY}, got {by!r}")
+    if group == "product":
+        codes, names = frame.product_codes, frame.product_names
+    else:
+        codes, names = frame.person_codes, frame.person_names
+    values = frame.qty if by == "quantity" else frame.revenue()
+    return dict(zip(names, group_sum(codes, values, len(names)).tolist()))
+
+
+def top_products(data, k=5, by="quantity"):
+    frame = data if isinstance(data, SalesFrame) else SalesFrame.from_records(data)
+    return top_k(group_totals(frame, "product", by), k)
+
+
+def top_salespeople(data, k=5, by="revenue"):
+    frame = data if isinstance(data, SalesFrame) else SalesFrame.from_records(data)
+    return top_k(group_totals(frame, "person", by), k)
+
+
+# ===============================
+# Approximate top-K (Space-Saving)
+# ===============================
+class SpaceSaving:
+    def __init__(self, capacity):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+        self.total = 0
+        # Error carried over from merged sketches, and the total weight at
+        # that point; weight added afterwards errs by at most 1/capacity.
+        self.merged_error = 0
+        self.merged_total = 0
+        # Min-heap of (count, key). Entries go stale when a count grows, so
+        # they are checked against self.counts when popped.
+        self._heap = []
+
+    def __len__(self):
+        return len(self.counts)
+
+    def _push(self, key):
+        heapq.heappush(self._heap, (self.counts[key], key))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(count, key) for key, count in self.counts.items()]
+            heapq.heapify(self._heap)
+
+    # Smallest current counter (its key, count)
+    def _pop_min(self):
+        while True:
+            count, key = heapq.heappop(self._heap)
+            if self.counts.get(key) == count:
+                return key, count
+
+    def update(self, key, weight=1):
+        self.total += weight
+        if key in self.counts:
+            self.counts[key] += weight
+        elif len(self.counts) < self.capacity:
+            self.counts[key] = weight
+            self.errors[key] = 0
+        else:
+            # Replace the smallest counter; the newcomer inherits its count
+            # as possible over-estimation.
+            old_key, old_count = self._pop_min()
+            del self.counts[old_key]
+            del self.errors[old_key]
+            self.counts[key] = old_count + weight
+            self.errors[key] = old_count
+        self._push(key)
+
+    def update_many(self, keys, weights):
+        for key, weight in zip(keys, weights):
+            self.update(key, weight)
+
+    # Maximum amount any reported count can be too high
+    def error_bound(self):
+        return self.merged_error + (self.total - self.merged_total) / self.capacity
+
+    def top(self, k):
+        return top_k(self.counts, k)
+
+    # Combine two sketches (e.g. two shards or two days).
+    # A key missing from a full sketch may still have been counted there up
+    # to that sketch's smallest counter, so that amount is added to keep every
+    # estimate an upper bound. The error bounds add up (N1/k1 + N2/k2).
+    def merge(self, other):
+        merged = SpaceSaving(max(self.capacity, other.capacity))
+        self_floor = min(self.counts.values()) if len(self) == self.capacity else 0
+        other_floor = min(other.counts.values()) if len(other) == other.capacity else 0
+        counts, errors = {}, {}
+        for key in list(self.counts) + [key for key in other.counts if key not in self.counts]:
+            counts[key] = self.counts.get(key, self_floor) + other.counts.get(key, other_floor)
+            errors[key] = (self.errors.get(key, self_floor)
+                           + other.errors.get(key, other_floor))
+        for key, count in top_k(counts, merged.capacity):
+            merged.counts[key] = count
+            merged.errors[key] = errors[key]
+        merged.total = merged.merged_total = self.total + other.total
+        merged.merged_error = self.error_bound() + other.error_bound()
+        merged._heap = [(count, key) for key, count in merged.counts.items()]
+        heapq.heapify(merged._heap)
+        return merged
+
+
+# Approximate top-K products over batches (e.g. sales_stream.read_sales_batches)
+# using a Space-Saving sketch with `capacity` counters (default 10 * k).
+def streaming_top_products(batches, k=5, by="quantity", capacity=None):
+    if by not in VALID_BY:
+        raise ValueError(f"by must be one of {VALID_BY}, got {by!r}")
+    sketch = SpaceSaving(capacity or 10 * k)
+    for batch in batches:
+        frame = SalesFrame.from_records(batch)
+        # Pre-aggregate inside the batch so the sketch sees one update per product
+        totals = group_totals(frame, "product", by)
+        sketch.update_many(totals.keys(), totals.values())
+    return sketch.top(k)
+
+
+if __name__ == "__main__":
+    sales_data = [
+        ("Laptop", 50000, 2, "Rahul"),
+        ("Mobile", 15000, 5, "Shalini"),
+        ("Tablet", 20000, 3, "Amit"),
+        ("Laptop", 50000, 1, "Shalini"),
+        ("Headphones", 2000, 10, "Rahul"),
+        ("Charger", 800, 15, "Amit"),
+        ("Mobile", 15000, 2, "Rahul"),
+        ("Laptop", 50000, 1, "Amit"),
+        ("Tablet", 20000, 1, "Shalini"),
+        ("Headphones", 2000, 5, "Rahul")
+    ]
+
+    print("Top 3 products by quantity:", top_products(sales_data, 3))
+    print("Top 3 products by revenue:", top_products(sales_data, 3, by="revenue"))
+    print("Top 2 salespeople by revenue:", top_salespeople(sales_data, 2))
+
+    sketch = SpaceSaving(capacity=3)
+    for product, price, qty, person in sales_data:
+        sketch.update(product, qty)
+    print("Approx top 2 products:", sketch.top(2), "±", sketch.error_bound())
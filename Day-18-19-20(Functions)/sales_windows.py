@@ -0,0 +1,213 @@
+"""
+========================================
+  Sales Data Analysis - Time Windows
+========================================
+
+The sales_data tuples in Practices.py have no time, so a question like
+"revenue per salesperson in the last hour" means rescanning everything.
+
+1. Transaction
+   (product, price, quantity, salesperson, timestamp) as a namedtuple.
+   timestamp = seconds since the epoch (time.time()) or a datetime.
+
+2. SalesRollup
+   Every transaction is pre-aggregated into fixed-size ring buffers of
+   minute, hour and day buckets. A bucket holds total revenue, count,
+   revenue per salesperson and quantity per product. Old buckets are
+   overwritten as time moves on, so memory is fixed.
+
+   - tumbling windows → one calendar bucket ("the hour of 10:00-11:00")
+                        Buckets are cut in UTC by default; pass
+                        SalesRollup(utc_offset=...) (seconds or a
+                        timedelta, e.g. +5:30) to get local calendar days.
+                        The offset is fixed - a DST change is not followed.
+   - sliding windows  → the last N buckets ending at `end`
+                        ("the last 60 minutes")
+
+   A query only reads the buckets inside the window - its cost depends on
+   the number of buckets, never on the number of transactions.
+   Sliding windows are aligned to bucket boundaries: "last hour" with
+   minute buckets covers the current minute and the 59 before it.
+
+How to use:
+    from sales_windows import Transaction, SalesRollup
+    rollup = SalesRollup()
+    rollup.add(Transaction("Laptop", 50000, 2, "Rahul", time.time()))
+    print(rollup.sales_by_person(window="hour"))
+"""
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+from sales_stream import merge_counts
+
+Transaction = namedtuple("Transaction", ["product", "price", "quantity", "salesperson", "timestamp"])
+
+UNITS = {"minute": 60, "hour": 3600, "day": 86400}
+
+# Buckets kept per unit: 2 days of minutes, 8 weeks of hours, ~2 years of days
+DEFAULT_RETENTION = {"minute": 2 * 1440, "hour": 8 * 168, "day": 2 * 365}
+
+
+def to_seconds(timestamp):
+    if isinstance(timestamp, datetime):
+        return timestamp.timestamp()
+    return timestamp
+
+
+# ===============================
+# Ring buffer of time buckets
+# ===============================
+class RingBuffer:
+    def __init__(self, unit_seconds, size):
+        self.unit_seconds = unit_seconds
+        self.size = size
+        self.bucket_ids = [None] * size
+        self.totals = [0] * size
+        self.counts = [0] * size
+        self.person_revenue = [None] * size
+        self.product_qty = [None] * size
+
+    def add(self, bucket_id, product, qty, person, revenue):
+        slot = bucket_id % self.size
+        current = self.bucket_ids[slot]
+        if current != bucket_id:
+            if current is not None and current > bucket_id:
+                return  # older than the retention of this buffer
+            self.bucket_ids[slot] = bucket_id
+            self.totals[slot] = 0
+            self.counts[slot] = 0
+            self.person_revenue[slot] = {}
+            self.product_qty[slot] = {}
+        self.totals[slot] += revenue
+        self.counts[slot] += 1
+        self.person_revenue[slot][person] = self.person_revenue[slot].get(person, 0) + revenue
+        self.product_qty[slot][product] = self.product_qty[slot].get(product, 0) + qty
+
+    # Slots whose buckets fall in (last_id - n, last_id]
+    def slots(self, last_id, n):
+        if n > self.size:
+            raise ValueError(f"window of {n} buckets exceeds retention of {self.size}")
+        for bucket_id in range(last_id - n + 1, last_id + 1):
+            slot = bucket_id % self.size
+            if self.bucket_ids[slot] == bucket_id:
+                yield slot
+
+
+# ===============================
+# Rollup engine
+# ===============================
+class SalesRollup:
+    # utc_offset: shift of the local time zone from UTC (seconds or a
+    # timedelta). Bucket boundaries - midnight for days - follow local time.
+    def __init__(self, retention=None, utc_offset=0):
+        if isinstance(utc_offset, timedelta):
+            utc_offset = utc_offset.total_seconds()
+        self.utc_offset = utc_offset
+        retention = dict(DEFAULT_RETENTION, **(retention or {}))
+        self.buffers = {unit: RingBuffer(seconds, retention[unit])
+                        for unit, seconds in UNITS.items()}
+        self.latest = None
+
+    # Seconds on the local clock, so that bucket ids start at local midnight
+    def local_seconds(self, timestamp):
+        return to_seconds(timestamp) + self.utc_offset
+
+    def add(self, transaction):
+        product, price, qty, person, timestamp = transaction
+        seconds = self.local_seconds(timestamp)
+        revenue = price * qty
+        for buffer in self.buffers.values():
+            buffer.add(int(seconds // buffer.unit_seconds), product, qty, person, revenue)
+        if self.latest is None or seconds > self.latest:
+            self.latest = seconds
+
+    def extend(self, transactions):
+        for transaction in transactions:
+            self.add(transaction)
+
+    # Pick the finest unit that covers `window` seconds exactly and still
+    # fits in its ring buffer (sharpest window edge).
+    def _plan(self, window):
+        if window in UNITS:
+            window = UNITS[window]
+        for unit in ("minute", "hour", "day"):
+            buffer = self.buffers[unit]
+            if window % buffer.unit_seconds == 0 and window // buffer.unit_seconds <= buffer.size:
+                return buffer, int(window // buffer.unit_seconds)
+        raise ValueError(f"window of {window} seconds is not a whole number of minutes "
+                         f"or exceeds the retention")
+
+    def _collect(self, buffer, slots):
+        stats = {"total": 0, "count": 0, "person_revenue": {}, "product_qty": {}}
+        for slot in slots:
+            stats["total"] += buffer.totals[slot]
+            stats["count"] += buffer.counts[slot]
+            merge_counts(stats["person_revenue"], buffer.person_revenue[slot])
+            merge_counts(stats["product_qty"], buffer.product_qty[slot])
+        return stats
+
+    # Sliding window: `window` ("minute"/"hour"/"day" or seconds) ending at
+    # `end` (default: the latest transaction seen).
+    def window_stats(self, window="hour", end=None):
+        buffer, n = self._plan(window)
+        end = self.latest if end is None else self.local_seconds(end)
+        if end is None:
+            return self._collect(buffer, [])
+        last_id = int(end // buffer.unit_seconds)
+        return self._collect(buffer, buffer.slots(last_id, n))
+
+    # Tumbling window: the whole calendar minute/hour/day containing `at`
+    # (in UTC, or in the time zone given by utc_offset)
+    def tumbling_stats(self, unit, at):
+        buffer = self.buffers[unit]
+        bucket_id = int(self.local_seconds(at) // buffer.unit_seconds)
+        return self._collect(buffer, buffer.slots(bucket_id, 1))
+
+    # ===============================
+    # Windowed reports
+    # ===============================
+    def total_revenue(self, window="hour", end=None):
+        return self.window_stats(window, end)["total"]
+
+    def sales_by_person(self, window="hour", end=None):
+        return self.window_stats(window, end)["person_revenue"]
+
+    def best_selling_product(self, window="hour", end=None):
+        product_sales = self.window_stats(window, end)["product_qty"]
+        best_product = max(product_sales, key=product_sales.get)
+        return best_product, product_sales[best_product]
+
+    def average_sales(self, window="hour", end=None):
+        stats = self.window_stats(window, end)
+        return stats["total"] / stats["count"]
+
+
+if __name__ == "__main__":
+    sales_data = [
+        ("Laptop", 50000, 2, "Rahul"),
+        ("Mobile", 15000, 5, "Shalini"),
+        ("Tablet", 20000, 3, "Amit"),
+        ("Laptop", 50000, 1, "Shalini"),
+        ("Headphones", 2000, 10, "Rahul"),
+        ("Charger", 800, 15, "Amit"),
+        ("Mobile", 15000, 2, "Rahul"),
+        ("Laptop", 50000, 1, "Amit"),
+        ("Tablet", 20000, 1, "Shalini"),
+        ("Headphones", 2000, 5, "Rahul")
+    ]
+
+    # One transaction every 20 minutes starting 1 Jan 2025, 09:00
+    start = datetime(2025, 1, 1, 9, 0).timestamp()
+    # Day buckets follow the local calendar (the demo times are local)
+    rollup = SalesRollup(utc_offset=datetime.fromtimestamp(start).astimezone().utcoffset())
+    for i, (product, price, qty, person) in enumerate(sales_data):
+        rollup.add(Transaction(product, price, qty, person, start + i * 20 * 60))
+
+    print("Revenue in the last hour:", rollup.total_revenue("hour"))
+    print("Sales per person, last hour:", rollup.sales_by_person("hour"))
+    print("Revenue in the last 30 minutes:", rollup.total_revenue(30 * 60))
+    print("Revenue in the 09:00-10:00 hour:",
+          rollup.tumbling_stats("hour", datetime(2025, 1, 1, 9, 30))["total"])
+    print("Revenue for the whole day:", rollup.total_revenue("day"))
+    print("Revenue on 1 Jan 2025:",
+          rollup.tumbling_stats("day", datetime(2025, 1, 1, 23, 59))["total"])
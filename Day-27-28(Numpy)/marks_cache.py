@@ -0,0 +1,159 @@
+"""
+========================================
+  Student Marks - Parsed-Array Cache
+========================================
+
+Every run of p27.py parses students.csv as text twice (loadtxt and
+genfromtxt), and text parsing is the slowest part of the whole pipeline.
+
+This module parses the CSV once and saves the resulting arrays as .npy
+sidecar files in a `.npcache` folder next to the CSV, one subfolder per
+CSV file name:
+
+    students.csv
+    .npcache/students.csv/marks-2-3-4.npy   ← numeric marks (loadtxt)
+    .npcache/students.csv/table.npy         ← structured array (genfromtxt)
+    .npcache/students.csv/<name>.json       ← size, mtime, SHA-256 of the CSV
+
+Later loads open the .npy with np.load(mmap_mode="r"): no parsing and no
+copy - pages are read from disk only when used.
+
+A cache entry is thrown away and rebuilt when the CSV changes:
+- size or mtime differ → the content hash is checked
+- hash differs         → re-parse
+- hash equal (file only touched) → keep the cache, store the new mtime
+verify_hash=True always checks the hash, even if size and mtime match.
+
+How to use:
+    from marks_cache import load_marks_cached, load_table_cached
+    marks = load_marks_cached("students.csv")        # like loadtxt(usecols=(2, 3, 4))
+    table = load_table_cached("students.csv")        # like genfromtxt(names=True)
+"""
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+
+CACHE_DIR = ".npcache"
+
+
+# ------------------------------------------------------------------
+# Helpers
+# ------------------------------------------------------------------
+def file_sha256(path, block_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# .npcache/<csv file name>/ - holds the cache entries of this CSV only
+def cache_folder(csv_file):
+    csv_file = os.path.abspath(csv_file)
+    return os.path.join(os.path.dirname(csv_file), CACHE_DIR, os.path.basename(csv_file))
+
+
+def sidecar_paths(csv_file, name):
+    folder = cache_folder(csv_file)
+    prefix = os.path.join(folder, name)
+    return folder, prefix + ".npy", prefix + ".json"
+
+
+def write_json(path, data):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+# Is the cached entry (meta) still valid for the CSV as it is now?
+def is_fresh(csv_file, meta, meta_file, verify_hash):
+    stat = os.stat(csv_file)
+    if meta.get("size") != stat.st_size:
+        return False
+    if meta.get("mtime_ns") == stat.st_mtime_ns and not verify_hash:
+        return True
+    if meta.get("sha256") != file_sha256(csv_file):
+        return False
+    if meta.get("mtime_ns") != stat.st_mtime_ns:
+        # Touched but not changed: remember the new mtime
+        meta["mtime_ns"] = stat.st_mtime_ns
+        write_json(meta_file, meta)
+    return True
+
+
+# ------------------------------------------------------------------
+# Cache core
+# ------------------------------------------------------------------
+# Return parse(csv_file) from the cache if it is still valid, otherwise
+# parse, save the sidecar and return the memory-mapped result.
+def cached_parse(csv_file, name, parse, verify_hash=False):
+    folder, npy_file, meta_file = sidecar_paths(csv_file, name)
+    if os.path.exists(npy_file) and os.path.exists(meta_file):
+        with open(meta_file, encoding="utf-8") as f:
+            meta = json.load(f)
+        if is_fresh(csv_file, meta, meta_file, verify_hash):
+            return np.load(npy_file, mmap_mode="r")
+
+    stat = os.stat(csv_file)
+    sha256 = file_sha256(csv_file)
+    array = parse(csv_file)
+    os.makedirs(folder, exist_ok=True)
+    tmp_file = npy_file + ".tmp.npy"
+    np.save(tmp_file, array)
+    os.replace(tmp_file, npy_file)
+    write_json(meta_file, {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+                           "sha256": sha256})
+    return np.load(npy_file, mmap_mode="r")
+
+
+# Remove all cache files of one CSV (other CSVs, e.g. students.csv.bak,
+# have their own folder and are left alone)
+def clear_cache(csv_file):
+    shutil.rmtree(cache_folder(csv_file), ignore_errors=True)
+
+
+# ------------------------------------------------------------------
+# Cached versions of the p27.py loaders
+# ------------------------------------------------------------------
+
+# Program 1 / 3: np.loadtxt(csv_file, delimiter=",", skiprows=1, usecols=usecols)
+def load_marks_cached(csv_file, usecols=(2, 3, 4), verify_hash=False):
+    name = "marks-" + "-".join(str(c) for c in usecols)
+    return cached_parse(
+        csv_file, name,
+        lambda path: np.loadtxt(path, delimiter=",", skiprows=1, usecols=usecols),
+        verify_hash)
+
+
+# Program 2: np.genfromtxt(csv_file, delimiter=",", dtype=None, encoding="utf-8", names=True)
+def load_table_cached(csv_file, verify_hash=False):
+    return cached_parse(
+        csv_file, "table",
+        lambda path: np.genfromtxt(path, delimiter=",", dtype=None,
+                                   encoding="utf-8", names=True),
+        verify_hash)
+
+
+if __name__ == "__main__":
+    import time
+
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    csv_file = os.path.join(base_path, "students.csv")
+    clear_cache(csv_file)
+
+    start = time.perf_counter()
+    marks = load_marks_cached(csv_file)
+    print(f"Cold load (parse + save): {time.perf_counter() - start:.5f}s")
+
+    start = time.perf_counter()
+    marks = load_marks_cached(csv_file)
+    print(f"Warm load (memory-mapped): {time.perf_counter() - start:.5f}s")
+    print("Marks:\n", marks)
+
+    table = load_table_cached(csv_file)
+    print("Student Names:", table["Name"])
+    print("Math Marks:", table["Math"])
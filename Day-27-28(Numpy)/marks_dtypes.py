@@ -0,0 +1,205 @@
+"""
+========================================
+  Student Marks - Compact dtypes
+========================================
+
+np.loadtxt always returns float64 - 8 bytes per mark - although marks
+from 0 to 100 fit in a uint8 (1 byte). On large class files that is 8x
+the memory actually needed.
+
+1. load_marks(..., compact=True)
+   Streams the CSV with the chunked loader and picks, per column, the
+   narrowest dtype that holds every value exactly:
+       whole numbers → uint8 / int8 / uint16 / int16 / uint32 / int32 / int64
+       fractions     → float32 if every value survives the round trip,
+                       otherwise float64
+   The range and kind of values are tracked over all chunks and the
+   dtype is chosen once from them, so it does not depend on where the
+   chunks split and nothing ever overflows. The result is a structured
+   array: data["Math"], data["Science"], ...
+
+2. Reductions in a wider dtype
+   uint8 + uint8 overflows at 255 (200 + 100 → 44!). column_sum(),
+   column_mean() and row_totals() accumulate in int64 / float64 so the
+   results stay correct.
+
+3. memory_report()
+   Uses itemsize and nbytes (see p27.py, "Attributes") to show what each
+   column costs compared with float64.
+
+How to use:
+    from marks_dtypes import load_marks, memory_report, row_totals
+    data = load_marks("students.csv")
+    print(memory_report(data))
+    print(row_totals(data))
+"""
+import os
+
+import numpy as np
+
+from marks_loader import DEFAULT_CHUNK_ROWS, MARK_COLUMNS, iter_marks_chunks
+
+INTEGER_DTYPES = [np.uint8, np.int8, np.uint16, np.int16, np.uint32, np.int32, np.int64]
+
+
+# ------------------------------------------------------------------
+# dtype selection
+# ------------------------------------------------------------------
+
+# What a column needs to be stored exactly: its range, whether every value
+# is a whole number, and whether every value survives a float32 round trip.
+# Stats of several chunks combine with merge_stats(), so the dtype can be
+# chosen once for the whole column.
+def column_stats(values):
+    values = np.asarray(values, dtype=np.float64)
+    if values.size == 0:
+        return None
+    integral = np.all(np.isfinite(values)) and np.array_equal(values, np.round(values))
+    float32 = np.array_equal(values.astype(np.float32).astype(np.float64), values, equal_nan=True)
+    return {"low": values.min(), "high": values.max(),
+            "integral": bool(integral), "float32": bool(float32)}
+
+
+def merge_stats(a, b):
+    if a is None or b is None:
+        return a or b
+    return {"low": min(a["low"], b["low"]), "high": max(a["high"], b["high"]),
+            "integral": a["integral"] and b["integral"],
+            "float32": a["float32"] and b["float32"]}
+
+
+def dtype_for(stats):
+    if stats is None:
+        return np.dtype(np.uint8)
+    if stats["integral"]:
+        for dtype in INTEGER_DTYPES:
+            info = np.iinfo(dtype)
+            if info.min <= stats["low"] and stats["high"] <= info.max:
+                return np.dtype(dtype)
+    return np.dtype(np.float32 if stats["float32"] else np.float64)
+
+
+# Narrowest dtype that stores every value of `values` exactly
+def narrowest_dtype(values):
+    return dtype_for(column_stats(values))
+
+
+# Cast with an overflow / precision check instead of silent wrap-around
+def safe_cast(values, dtype):
+    values = np.asarray(values)
+    dtype = np.dtype(dtype)
+    cast = values.astype(dtype)
+    if not np.array_equal(cast.astype(np.float64), values.astype(np.float64), equal_nan=True):
+        raise OverflowError(f"values do not fit exactly in {dtype}")
+    return cast
+
+
+def read_header(path, usecols):
+    with open(path, encoding="utf-8") as f:
+        names = f.readline().strip().split(",")
+    return [names[c] for c in usecols]
+
+
+# ------------------------------------------------------------------
+# Loader
+# ------------------------------------------------------------------
+def load_marks(path, usecols=MARK_COLUMNS, compact=True, chunk_rows=DEFAULT_CHUNK_ROWS):
+    names = read_header(path, usecols)
+    if not compact:
+        blocks = list(iter_marks_chunks(path, chunk_rows, usecols))
+        marks = np.concatenate(blocks) if blocks else np.empty((0, len(usecols)))
+        data = np.empty(len(marks), dtype=[(name, np.float64) for name in names])
+        for i, name in enumerate(names):
+            data[name] = marks[:, i]
+        return data
+
+    # Each chunk is kept in its own narrowest dtype; the column dtype is
+    # picked once from the combined stats (promoting chunk dtypes pairwise
+    # is not narrowest: int8 and uint8 promote to int16)
+    stats = [None] * len(names)
+    columns = [[] for _ in names]
+    for block in iter_marks_chunks(path, chunk_rows, usecols):
+        for i in range(len(names)):
+            chunk_stats = column_stats(block[:, i])
+            stats[i] = merge_stats(stats[i], chunk_stats)
+            columns[i].append(safe_cast(block[:, i], dtype_for(chunk_stats)))
+    dtypes = [dtype_for(column) for column in stats]
+
+    data = np.empty(sum(len(part) for part in columns[0]),
+                    dtype=[(name, dtype) for name, dtype in zip(names, dtypes)])
+    for name, parts, dtype in zip(names, columns, dtypes):
+        if parts:
+            # the column dtype holds every chunk's values, so this cast is exact
+            data[name] = np.concatenate([part.astype(dtype) for part in parts])
+    return data
+
+
+# ------------------------------------------------------------------
+# Reductions in a wide accumulator
+# ------------------------------------------------------------------
+def accumulator_dtype(dtype):
+    dtype = np.dtype(dtype)
+    if dtype.kind == "u":
+        return np.dtype(np.uint64)
+    if dtype.kind == "i":
+        return np.dtype(np.int64)
+    return np.dtype(np.float64)
+
+
+def column_sum(values):
+    return values.sum(dtype=accumulator_dtype(values.dtype))
+
+
+def column_mean(values):
+    return float(column_sum(values)) / len(values)
+
+
+# Total per student across all subject fields (int64 / float64)
+def row_totals(data):
+    names = data.dtype.names
+    kinds = {data.dtype[name].kind for name in names}
+    total = np.zeros(len(data), dtype=np.float64 if "f" in kinds else np.int64)
+    for name in names:
+        total += data[name]
+    return total
+
+
+# ------------------------------------------------------------------
+# Memory accounting
+# ------------------------------------------------------------------
+def memory_report(data):
+    lines = [f"{'column':<10} {'dtype':<8} {'itemsize':>8} {'nbytes':>12} {'as float64':>12}"]
+    float64_total = 0
+    for name in data.dtype.names:
+        column = data[name]
+        as_float64 = len(column) * np.dtype(np.float64).itemsize
+        float64_total += as_float64
+        lines.append(f"{name:<10} {str(column.dtype):<8} {column.itemsize:>8} "
+                     f"{column.nbytes:>12} {as_float64:>12}")
+    saved = 1 - data.nbytes / float64_total if float64_total else 0.0
+    lines.append(f"{'total':<10} {'':<8} {data.itemsize:>8} {data.nbytes:>12} "
+                 f"{float64_total:>12}  ({saved:.0%} saved)")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    data = load_marks(os.path.join(base_path, "students.csv"))
+    print("Compact dtypes:", data.dtype)
+    print(memory_report(data))
+    print("Totals (no uint8 overflow):", row_totals(data))
+    print("Math average:", column_mean(data["Math"]))
+
+    # A bigger class file: 1,000,000 students
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "big.csv")
+        marks = rng.integers(0, 101, size=(1_000_000, 3))
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("ID,Name,Math,Science,English\n")
+            f.writelines(f"{i},S{i},{a},{b},{c}\n" for i, (a, b, c) in enumerate(marks.tolist()))
+        big = load_marks(path)
+        print()
+        print(memory_report(big))
@@ -0,0 +1,171 @@
+"""
+========================================
+  Student Marks - Incremental Results
+========================================
+
+p27.py recomputes Total and Average for every student and rewrites
+results.csv from scratch on each run, even if only a few students were
+added to students.csv since yesterday.
+
+update_results() remembers, in a small JSON state file, how far it got:
+- byte offset and row count already processed in students.csv
+- a hash of the last 4 KB before that offset (to notice rewrites)
+- the size results.csv had after the last run
+
+On the next run it seeks straight to the stored offset, reads only the
+new rows, computes their Total/Average and appends them to results.csv -
+O(new rows). If students.csv was edited rather than appended to (smaller,
+or the bytes before the offset changed), or the state is missing,
+results.csv is rebuilt from the start.
+
+A last line without a newline is processed as a complete row, and where
+it started is kept in the state ("pending"). If students.csv has grown
+past it by the next run - the line was still being written, or a newline
+and more rows were added - that row is dropped from results.csv and
+computed again from the full line.
+
+How to use:
+    from marks_incremental import update_results
+    new_rows = update_results("students.csv", "results.csv")
+"""
+import hashlib
+import json
+import os
+from itertools import islice
+
+import numpy as np
+
+from marks_loader import DEFAULT_CHUNK_ROWS, MARK_COLUMNS
+from marks_writer import format_block
+
+RESULTS_HEADER = "Math,Science,English,Total,Average"
+TAIL_BYTES = 4096
+
+
+def tail_hash(f, offset):
+    start = max(0, offset - TAIL_BYTES)
+    f.seek(start)
+    return hashlib.sha256(f.read(offset - start)).hexdigest()
+
+
+def load_state(state_file):
+    try:
+        with open(state_file, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_state(state_file, state):
+    tmp_path = state_file + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, state_file)
+
+
+# Can we continue from `state`, or must results.csv be rebuilt?
+def can_resume(csv, state, output_file):
+    if not state or not os.path.exists(output_file):
+        return False
+    if os.path.getsize(output_file) < state["results_size"]:
+        return False
+    csv.seek(0, os.SEEK_END)
+    if csv.tell() < state["offset"]:
+        return False
+    return tail_hash(csv, state["offset"]) == state["tail_sha256"]
+
+
+def write_results(out, lines, usecols):
+    lines = [line.decode("utf-8") for line in lines if line.strip()]
+    if not lines:
+        return 0
+    marks = np.loadtxt(lines, delimiter=",", usecols=usecols, ndmin=2)
+    result = np.column_stack((marks, np.sum(marks, axis=1), np.mean(marks, axis=1)))
+    out.write(format_block(result, ",", os.linesep))
+    return len(marks)
+
+
+# Process students.csv from `offset`, appending result rows to `out`.
+# Returns (new offset, rows processed, pending). pending is None, or
+# (offset, rows, results size) from just before an unterminated last line.
+def process_from(csv, out, offset, usecols, chunk_rows):
+    csv.seek(offset)
+    if offset == 0:
+        offset += len(csv.readline())  # header
+    rows = 0
+    while True:
+        lines = list(islice(csv, chunk_rows))
+        if not lines:
+            return offset, rows, None
+        if lines[-1].endswith(b"\n"):
+            offset += sum(len(line) for line in lines)
+            rows += write_results(out, lines, usecols)
+            continue
+        last = lines.pop()  # end of file without a newline
+        offset += sum(len(line) for line in lines)
+        rows += write_results(out, lines, usecols)
+        pending = (offset, rows, out.tell())
+        rows += write_results(out, [last], usecols)
+        return offset + len(last), rows, pending
+
+
+# Bring output_file up to date with csv_file. Returns the number of new rows
+# (a re-read unterminated last line counts again).
+def update_results(csv_file, output_file, state_file=None, usecols=MARK_COLUMNS,
+                   chunk_rows=DEFAULT_CHUNK_ROWS):
+    state_file = state_file or output_file + ".state.json"
+    state = load_state(state_file)
+
+    with open(csv_file, "rb") as csv:
+        kept = None
+        if can_resume(csv, state, output_file):
+            kept = state.get("pending")
+            if kept and csv.seek(0, os.SEEK_END) > state["offset"]:
+                # the unterminated last line grew - compute its row again
+                state = dict(state, offset=kept["offset"], rows=kept["rows"],
+                             results_size=kept["results_size"])
+                kept = None
+            out = open(output_file, "r+b")
+            out.truncate(state["results_size"])  # drop rows of an interrupted run
+            out.seek(0, os.SEEK_END)
+            offset, total_rows = state["offset"], state["rows"]
+        else:
+            out = open(output_file, "wb")
+            out.write((RESULTS_HEADER + os.linesep).encode("latin-1"))
+            offset, total_rows = 0, 0
+
+        with out:
+            offset, new_rows, pending = process_from(csv, out, offset, usecols, chunk_rows)
+            out.flush()
+            results_size = out.tell()
+        if pending:
+            pending_offset, pending_rows, pending_size = pending
+            pending = {"offset": pending_offset, "rows": total_rows + pending_rows,
+                       "results_size": pending_size}
+        else:
+            pending = kept  # nothing new was read - the last line is still open
+        save_state(state_file, {"offset": offset, "rows": total_rows + new_rows,
+                                "tail_sha256": tail_hash(csv, offset),
+                                "results_size": results_size, "pending": pending})
+    return new_rows
+
+
+if __name__ == "__main__":
+    import shutil
+    import tempfile
+
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_file = os.path.join(tmp, "students.csv")
+        output_file = os.path.join(tmp, "results.csv")
+        shutil.copy(os.path.join(base_path, "students.csv"), csv_file)
+
+        print("First run, rows processed:", update_results(csv_file, output_file))
+        print("Nothing new, rows processed:", update_results(csv_file, output_file))
+
+        with open(csv_file, "a", encoding="utf-8") as f:
+            f.write("6,Priya,88,91,79\n7,Karan,73,64,81\n")
+        print("After 2 admissions, rows processed:", update_results(csv_file, output_file))
+
+        with open(output_file, encoding="utf-8") as f:
+            print(f.read())
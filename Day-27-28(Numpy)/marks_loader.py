@@ -0,0 +1,100 @@
+"""
+========================================
+  Student Marks - Chunked CSV Loader
+========================================
+
+Programs 1 and 3 of p27.py call
+    np.loadtxt(csv_file, delimiter=",", skiprows=1, usecols=(2, 3, 4))
+which loads the whole file into memory - and they do it twice.
+National exam files have tens of millions of rows.
+
+iter_marks_chunks() reads the CSV in blocks of `chunk_rows` lines and turns
+every block into a NumPy array (only the requested columns). Each block is
+parsed by np.loadtxt's fast C parser, but memory never holds more than one
+block.
+
+marks_statistics() builds the Program 3 statistics on top of it as
+streaming reductions (running sum / max / min / count), so the file is read
+exactly once and memory stays bounded.
+
+How to use:
+    from marks_loader import iter_marks_chunks, marks_statistics
+    for block in iter_marks_chunks("students.csv", chunk_rows=100_000):
+        print(block.shape)
+    print(marks_statistics("students.csv"))
+"""
+import os
+from itertools import islice
+
+import numpy as np
+
+SUBJECTS = ("Math", "Science", "English")
+MARK_COLUMNS = (2, 3, 4)
+DEFAULT_CHUNK_ROWS = 100_000
+
+
+# ------------------------------------------------------------------
+# Chunked loader
+# ------------------------------------------------------------------
+# Yields 2D arrays of shape (<= chunk_rows, len(usecols)).
+def iter_marks_chunks(path, chunk_rows=DEFAULT_CHUNK_ROWS, usecols=MARK_COLUMNS,
+                      skiprows=1, delimiter=",", dtype=np.float64):
+    if chunk_rows <= 0:
+        raise ValueError("chunk_rows must be positive")
+    with open(path, encoding="utf-8") as f:
+        for _ in range(skiprows):
+            next(f, None)
+        while True:
+            raw = list(islice(f, chunk_rows))
+            if not raw:
+                return
+            lines = [line for line in raw if line.strip()]
+            if not lines:
+                continue
+            yield np.loadtxt(lines, delimiter=delimiter, usecols=usecols,
+                             dtype=dtype, ndmin=2)
+
+
+# ------------------------------------------------------------------
+# Program 3 as streaming reductions
+# ------------------------------------------------------------------
+def marks_statistics(path, chunk_rows=DEFAULT_CHUNK_ROWS, usecols=MARK_COLUMNS):
+    count = 0
+    total = np.zeros(len(usecols), dtype=np.float64)
+    highest = np.full(len(usecols), -np.inf)
+    lowest = np.full(len(usecols), np.inf)
+    for block in iter_marks_chunks(path, chunk_rows, usecols):
+        count += block.shape[0]
+        total += block.sum(axis=0, dtype=np.float64)
+        np.maximum(highest, block.max(axis=0), out=highest)
+        np.minimum(lowest, block.min(axis=0), out=lowest)
+    if count == 0:
+        raise ValueError(f"{path} has no data rows")
+    mean = total / count
+    return {
+        "count": count,
+        "mean": mean,
+        "max": highest,
+        "min": lowest,
+        # every student has the same number of subjects, so the overall
+        # average equals the mean of the per-subject means (np.mean(marks))
+        "overall_mean": total.sum() / (count * len(usecols)),
+    }
+
+
+if __name__ == "__main__":
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    csv_file = os.path.join(base_path, "students.csv")
+
+    print("--- Chunked loading (2 rows per block) ---")
+    for block in iter_marks_chunks(csv_file, chunk_rows=2):
+        print(block)
+
+    stats = marks_statistics(csv_file, chunk_rows=2)
+    print("\n--- Program 3: Statistics (streaming) ---")
+    print("Average per subject [Math, Science, English]:", stats["mean"])
+    for i, subject in enumerate(SUBJECTS):
+        print(f"Highest in {subject}:", stats["max"][i])
+    for i, subject in enumerate(SUBJECTS):
+        print(f"Lowest in {subject}:", stats["min"][i])
+    print("Overall Class Average (all subjects):", stats["overall_mean"])
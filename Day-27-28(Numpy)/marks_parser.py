@@ -0,0 +1,166 @@
+"""
+========================================
+  Student Marks - Typed CSV Reader
+========================================
+
+Program 2 of p27.py uses
+    np.genfromtxt(csv_file, delimiter=",", dtype=None, encoding="utf-8", names=True)
+genfromtxt has to guess every column type and converts the file through
+Python lists, which is slow and memory-hungry on big files.
+
+read_students() instead:
+1. takes a schema - given explicitly or sampled from the first rows
+       [("ID", "int64"), ("Name", "category"), ("Math", "float64"), ...]
+2. parses each line ONCE into a structured array (np.loadtxt C parser,
+   block by block)
+3. dictionary-encodes string ("category") columns: the array stores small
+   int32 codes, and a lookup table holds every distinct name once,
+   instead of a wide unicode column with a copy of the name in every row
+
+How to use:
+    from marks_parser import read_students
+    data, lookups = read_students("students.csv")
+    print(data["Math"], lookups["Name"][data["Name"]])
+
+Run this file directly to benchmark it against genfromtxt.
+"""
+import os
+from itertools import islice
+
+import numpy as np
+
+CATEGORY = "category"
+DEFAULT_CHUNK_ROWS = 100_000
+MAX_STRING_LENGTH = 64
+
+
+# ------------------------------------------------------------------
+# Schema
+# ------------------------------------------------------------------
+def guess_kind(values):
+    for kind, convert in (("int64", int), ("float64", float)):
+        try:
+            for value in values:
+                convert(value)
+            return kind
+        except ValueError:
+            pass
+    return CATEGORY
+
+
+# Sample the header and the first `sample_rows` rows to build a schema
+def infer_schema(path, sample_rows=1000, delimiter=","):
+    with open(path, encoding="utf-8") as f:
+        names = f.readline().strip().split(delimiter)
+        rows = [line.rstrip("\n").split(delimiter)
+                for line in islice(f, sample_rows) if line.strip()]
+    columns = list(zip(*rows)) if rows else [()] * len(names)
+    return [(name, guess_kind(values)) for name, values in zip(names, columns)]
+
+
+# ------------------------------------------------------------------
+# Reader
+# ------------------------------------------------------------------
+def read_students(path, schema=None, chunk_rows=DEFAULT_CHUNK_ROWS, delimiter=",",
+                  max_string_length=MAX_STRING_LENGTH):
+    if schema is None:
+        schema = infer_schema(path, delimiter=delimiter)
+    # dtype the C parser fills in; category columns arrive as fixed-width text,
+    # one character wider than allowed so that longer values can be detected
+    parse_dtype = np.dtype([(name, f"U{max_string_length + 1}" if kind == CATEGORY else kind)
+                            for name, kind in schema])
+    # dtype of the result; category columns become int32 codes
+    out_dtype = np.dtype([(name, "int32" if kind == CATEGORY else kind)
+                          for name, kind in schema])
+    categories = [name for name, kind in schema if kind == CATEGORY]
+    indexes = {name: {} for name in categories}
+
+    blocks = []
+    with open(path, encoding="utf-8") as f:
+        f.readline()  # header
+        while True:
+            raw = list(islice(f, chunk_rows))
+            if not raw:
+                break
+            lines = [line for line in raw if line.strip()]
+            if not lines:
+                continue
+            parsed = np.loadtxt(lines, delimiter=delimiter, dtype=parse_dtype, ndmin=1)
+            block = np.empty(len(parsed), dtype=out_dtype)
+            for name, kind in schema:
+                if kind != CATEGORY:
+                    block[name] = parsed[name]
+                    continue
+                # The parser cuts long text to the field width; two names
+                # sharing their first characters would get the same code
+                if len(parsed) and np.char.str_len(parsed[name]).max() > max_string_length:
+                    raise ValueError(f"a value in column {name!r} is longer than "
+                                     f"max_string_length={max_string_length}")
+                # Encode through the distinct values of this block only
+                distinct, inverse = np.unique(parsed[name], return_inverse=True)
+                index = indexes[name]
+                codes = np.array([index.setdefault(value, len(index)) for value in distinct.tolist()],
+                                 dtype=np.int32)
+                block[name] = codes[inverse.ravel()]
+            blocks.append(block)
+
+    data = np.concatenate(blocks) if blocks else np.empty(0, dtype=out_dtype)
+    lookups = {name: np.array(list(indexes[name]), dtype=str) for name in categories}
+    return data, lookups
+
+
+# Turn a category column back into strings
+def decode(data, lookups, name):
+    return lookups[name][data[name]]
+
+
+# ------------------------------------------------------------------
+# Benchmark against genfromtxt
+# ------------------------------------------------------------------
+def write_sample_csv(path, n_rows, n_names=5000, seed=0):
+    rng = np.random.default_rng(seed)
+    names = np.array([f"Student{i}" for i in range(n_names)])
+    marks = rng.integers(0, 101, size=(n_rows, 3))
+    picked = names[rng.integers(0, n_names, size=n_rows)]
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("ID,Name,Math,Science,English\n")
+        for i in range(n_rows):
+            f.write(f"{i + 1},{picked[i]},{marks[i, 0]},{marks[i, 1]},{marks[i, 2]}\n")
+
+
+def benchmark(n_rows=200_000):
+    import tempfile
+    import time
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "students_big.csv")
+        write_sample_csv(path, n_rows)
+
+        start = time.perf_counter()
+        slow = np.genfromtxt(path, delimiter=",", dtype=None, encoding="utf-8", names=True)
+        slow_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        fast, lookups = read_students(path)
+        fast_time = time.perf_counter() - start
+
+    assert np.array_equal(slow["Math"], fast["Math"])
+    assert np.array_equal(slow["Name"], decode(fast, lookups, "Name"))
+    print(f"Rows: {n_rows}")
+    print(f"genfromtxt    : {slow_time:.3f}s  {slow.nbytes / 2**20:.1f} MB")
+    print(f"read_students : {fast_time:.3f}s  "
+          f"{(fast.nbytes + lookups['Name'].nbytes) / 2**20:.1f} MB")
+    print(f"Speed-up      : {slow_time / fast_time:.1f}x")
+
+
+if __name__ == "__main__":
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    csv_file = os.path.join(base_path, "students.csv")
+
+    print("Sampled schema:", infer_schema(csv_file))
+    data, lookups = read_students(csv_file)
+    print("Data:", data)
+    print("Student Names:", decode(data, lookups, "Name"))
+    print("Math Marks:", data["Math"])
+    print()
+    benchmark()
@@ -0,0 +1,168 @@
+"""
+========================================
+  Student Marks - Many School Files
+========================================
+
+p27.py only processes one hard-coded students.csv. Every school sends its
+own file in the same layout (ID,Name,Math,Science,English).
+
+process_shards() takes a folder or a glob pattern of such shard files and
+processes them concurrently in a process pool. Each worker:
+- streams its shard with the chunked loader (marks_loader.py)
+- computes partial statistics per subject:
+      count, sum, sum of squares, min, max
+- writes its Math,Science,English,Total,Average rows to a part file
+
+The parent then merges the partials exactly (counts and sums add up, min of
+mins, max of maxes) and writes
+- results.csv        → all part files joined in shard order, one header
+- shard_summary.csv  → count/mean/std/min/max per shard and subject, plus
+                       an ALL row for the merged totals
+
+Marks are whole numbers, so the float64 sums and sums of squares are exact
+and the merged statistics equal those of one big file.
+
+How to use:
+    python marks_shards.py "schools/*.csv" output_folder --workers 4
+"""
+import argparse
+import glob
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from marks_loader import DEFAULT_CHUNK_ROWS, SUBJECTS, iter_marks_chunks
+from marks_writer import format_block
+
+RESULTS_HEADER = "Math,Science,English,Total,Average"
+
+
+# ------------------------------------------------------------------
+# Shard discovery
+# ------------------------------------------------------------------
+def shard_files(source):
+    if os.path.isdir(source):
+        source = os.path.join(source, "*.csv")
+    files = sorted(glob.glob(source))
+    if not files:
+        raise FileNotFoundError(f"no shard files match {source!r}")
+    return files
+
+
+# ------------------------------------------------------------------
+# Partial statistics
+# ------------------------------------------------------------------
+def empty_partial(n_columns=len(SUBJECTS)):
+    return {"count": 0,
+            "sum": np.zeros(n_columns),
+            "sumsq": np.zeros(n_columns),
+            "min": np.full(n_columns, np.inf),
+            "max": np.full(n_columns, -np.inf)}
+
+
+def add_block(partial, block):
+    partial["count"] += block.shape[0]
+    partial["sum"] += block.sum(axis=0)
+    partial["sumsq"] += np.square(block).sum(axis=0)
+    np.minimum(partial["min"], block.min(axis=0), out=partial["min"])
+    np.maximum(partial["max"], block.max(axis=0), out=partial["max"])
+
+
+def merge_partials(partials):
+    merged = empty_partial(len(partials[0]["sum"]) if partials else len(SUBJECTS))
+    for partial in partials:
+        merged["count"] += partial["count"]
+        merged["sum"] += partial["sum"]
+        merged["sumsq"] += partial["sumsq"]
+        np.minimum(merged["min"], partial["min"], out=merged["min"])
+        np.maximum(merged["max"], partial["max"], out=merged["max"])
+    return merged
+
+
+# count/mean/variance/std/min/max (population variance, like np.var).
+# With no rows at all there is nothing to average - that is an error.
+def finalize(partial):
+    count = partial["count"]
+    if count == 0:
+        raise ValueError("no student rows - every shard is empty")
+    mean = partial["sum"] / count
+    variance = np.maximum(partial["sumsq"] / count - mean ** 2, 0.0)
+    return {"count": count, "mean": mean, "var": variance, "std": np.sqrt(variance),
+            "min": partial["min"], "max": partial["max"]}
+
+
+# Work done in each worker process: one shard → partial stats + part file
+def process_shard(path, part_file, chunk_rows=DEFAULT_CHUNK_ROWS):
+    partial = empty_partial()
+    with open(part_file, "wb") as out:
+        for block in iter_marks_chunks(path, chunk_rows):
+            add_block(partial, block)
+            result = np.column_stack((block, block.sum(axis=1), block.mean(axis=1)))
+            out.write(format_block(result, ",", os.linesep))
+    return partial
+
+
+# ------------------------------------------------------------------
+# Driver
+# ------------------------------------------------------------------
+def write_summary(path, files, partials, merged):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("Shard,Subject,Count,Mean,Std,Min,Max\n")
+        for name, partial in list(zip(files, partials)) + [("ALL", merged)]:
+            if partial["count"] == 0:
+                continue
+            stats = finalize(partial)
+            for i, subject in enumerate(SUBJECTS):
+                f.write(f"{os.path.basename(name)},{subject},{stats['count']},"
+                        f"{stats['mean'][i]:.2f},{stats['std'][i]:.2f},"
+                        f"{stats['min'][i]:.2f},{stats['max'][i]:.2f}\n")
+
+
+def process_shards(source, output_dir, workers=None, chunk_rows=DEFAULT_CHUNK_ROWS):
+    files = shard_files(source)
+    os.makedirs(output_dir, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=output_dir) as tmp:
+        part_files = [os.path.join(tmp, f"part-{i:05d}") for i in range(len(files))]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            partials = list(executor.map(process_shard, files, part_files,
+                                         [chunk_rows] * len(files)))
+
+        with open(os.path.join(output_dir, "results.csv"), "wb") as out:
+            out.write((RESULTS_HEADER + os.linesep).encode("latin-1"))
+            for part_file in part_files:
+                with open(part_file, "rb") as part:
+                    shutil.copyfileobj(part, out)
+
+    merged = merge_partials(partials)
+    write_summary(os.path.join(output_dir, "shard_summary.csv"), files, partials, merged)
+    return finalize(merged)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Aggregate many students.csv shards")
+    parser.add_argument("source", nargs="?", help="folder or glob pattern of shard CSVs")
+    parser.add_argument("output_dir", nargs="?", default="shard_output")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS)
+    args = parser.parse_args()
+
+    if args.source:
+        stats = process_shards(args.source, args.output_dir, args.workers, args.chunk_rows)
+    else:
+        # Demo: split students.csv into 3 "schools"
+        base_path = os.path.dirname(os.path.abspath(__file__))
+        with open(os.path.join(base_path, "students.csv"), encoding="utf-8") as f:
+            header, *rows = f.read().splitlines()
+        with tempfile.TemporaryDirectory() as tmp:
+            for i in range(3):
+                with open(os.path.join(tmp, f"school{i}.csv"), "w", encoding="utf-8") as f:
+                    f.write("\n".join([header] + rows[i::3]) + "\n")
+            stats = process_shards(tmp, os.path.join(tmp, "out"), workers=2)
+            with open(os.path.join(tmp, "out", "shard_summary.csv"), encoding="utf-8") as f:
+                print(f.read())
+    print("Average per subject [Math, Science, English]:", stats["mean"])
+    print("Std per subject:", stats["std"])
+    print("Highest:", stats["max"], "Lowest:", stats["min"])
@@ -0,0 +1,148 @@
+"""
+========================================
+  Student Marks - Running Statistics
+========================================
+
+Program 3 of p27.py gets the subject averages from np.mean(marks, axis=0)
+over the fully loaded array. There is no variance / standard deviation,
+and when a new student arrives everything has to be computed again.
+
+RunningStats keeps, per column (subject):
+    count, mean, M2 (sum of squared differences from the mean), min, max
+and updates them
+- per new student  → Welford's update, O(columns)
+- per block / file → Chan's parallel formula, merging a block's own
+                     statistics in one step
+
+Unlike "sum of squares minus square of sum", Welford/Chan never subtract
+two huge, almost equal numbers, so the variance stays accurate even for
+very long or badly scaled columns. Two RunningStats (two classes, two
+shards) merge into exactly the statistics of the combined data.
+
+How to use:
+    from marks_stats import RunningStats, stats_from_csv
+    stats = stats_from_csv("students.csv")
+    stats.add_row([88, 91, 79])          # a new student arrives
+    print(stats.mean, stats.std())
+"""
+import os
+
+import numpy as np
+
+from marks_loader import DEFAULT_CHUNK_ROWS, MARK_COLUMNS, SUBJECTS, iter_marks_chunks
+
+
+class RunningStats:
+    def __init__(self, n_columns=len(SUBJECTS)):
+        self.count = 0
+        self.mean = np.zeros(n_columns)
+        self.m2 = np.zeros(n_columns)
+        self.min = np.full(n_columns, np.inf)
+        self.max = np.full(n_columns, -np.inf)
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    # Welford: one new row in O(columns)
+    def add_row(self, row):
+        row = np.asarray(row, dtype=np.float64)
+        self.count += 1
+        delta = row - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (row - self.mean)
+        np.minimum(self.min, row, out=self.min)
+        np.maximum(self.max, row, out=self.max)
+
+    # Chan: summarise the block with NumPy, then merge it in one step
+    def add_block(self, block):
+        block = np.asarray(block, dtype=np.float64)
+        if block.ndim == 1:
+            block = block.reshape(1, -1)
+        if block.shape[0] == 0:
+            return
+        other = RunningStats(block.shape[1])
+        other.count = block.shape[0]
+        other.mean = block.mean(axis=0)
+        other.m2 = np.square(block - other.mean).sum(axis=0)
+        other.min = block.min(axis=0)
+        other.max = block.max(axis=0)
+        self.merge(other, in_place=True)
+
+    # Combine two sets of statistics (Chan et al.)
+    def merge(self, other, in_place=False):
+        target = self if in_place else self.copy()
+        if other.count == 0:
+            return target
+        if target.count == 0:
+            target.count = other.count
+            target.mean = other.mean.copy()
+            target.m2 = other.m2.copy()
+            target.min = other.min.copy()
+            target.max = other.max.copy()
+            return target
+        count = target.count + other.count
+        delta = other.mean - target.mean
+        target.mean = target.mean + delta * (other.count / count)
+        target.m2 = target.m2 + other.m2 + delta ** 2 * (target.count * other.count / count)
+        target.count = count
+        target.min = np.minimum(target.min, other.min)
+        target.max = np.maximum(target.max, other.max)
+        return target
+
+    def copy(self):
+        clone = RunningStats(len(self.mean))
+        clone.count = self.count
+        clone.mean = self.mean.copy()
+        clone.m2 = self.m2.copy()
+        clone.min = self.min.copy()
+        clone.max = self.max.copy()
+        return clone
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    # ddof=0 → population variance (np.var default), ddof=1 → sample variance
+    def variance(self, ddof=0):
+        if self.count <= ddof:
+            return np.full(len(self.mean), np.nan)
+        return self.m2 / (self.count - ddof)
+
+    def std(self, ddof=0):
+        return np.sqrt(self.variance(ddof))
+
+    # Average over all subjects of all students (np.mean(marks))
+    def overall_mean(self):
+        return float(self.mean.mean())
+
+    def summary(self):
+        return {"count": self.count, "mean": self.mean, "var": self.variance(),
+                "std": self.std(), "min": self.min, "max": self.max}
+
+
+# Feed RunningStats from the chunked loader - one read of the file
+def stats_from_csv(path, chunk_rows=DEFAULT_CHUNK_ROWS, usecols=MARK_COLUMNS):
+    stats = RunningStats(len(usecols))
+    for block in iter_marks_chunks(path, chunk_rows, usecols):
+        stats.add_block(block)
+    return stats
+
+
+if __name__ == "__main__":
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    csv_file = os.path.join(base_path, "students.csv")
+
+    stats = stats_from_csv(csv_file, chunk_rows=2)
+    print("--- Class statistics ---")
+    print("Students:", stats.count)
+    print("Average per subject [Math, Science, English]:", stats.mean)
+    print("Std per subject:", stats.std())
+    print("Highest:", stats.max, "Lowest:", stats.min)
+    print("Overall Class Average (all subjects):", stats.overall_mean())
+
+    # A new student joins - O(3) update, no reload
+    stats.add_row([88, 91, 79])
+    print("\nAfter a new student joins:")
+    print("Average per subject:", stats.mean)
+    print("Std per subject:", stats.std())
@@ -0,0 +1,219 @@
+"""
+========================================
+  Student Marks - Binary Marks Store
+========================================
+
+Text formats (CSV) must be parsed on every run. MarksStore keeps the
+student table in a fixed-layout binary file instead, opened with np.memmap.
+
+File layout (.marks):
+    header   4096 bytes: b"MARKSTOR" + JSON (version, subjects, record dtype)
+    records  one fixed-size record per student, back to back:
+                 ID        int64
+                 name      int32   (code into the names file)
+                 marks     float32 or uint8, one per subject
+Names file (.marks.names): one student name per line; line number = code.
+
+- store.marks is a (students, subjects) view of the memory map, and
+  store.marks[:, 0] (Math) is a strided view - no copy, no parsing.
+- append() (store opened with mode="r+") writes new records at the end of
+  the file and new names at the end of the names file; nothing already
+  written is rewritten. The row count comes from the file size, so the
+  header never changes. A partial record or name left by an interrupted
+  append is ignored and cut off by the next append.
+
+How to use:
+    from marks_store import MarksStore, import_csv
+    store = import_csv("students.csv", "students.marks")
+    print(store.marks[:, 0].mean())                  # Math average
+    store.append([6], ["Priya"], [[88, 91, 79]])
+"""
+import csv
+import json
+import os
+from itertools import islice
+
+import numpy as np
+
+from marks_loader import DEFAULT_CHUNK_ROWS, SUBJECTS
+
+MAGIC = b"MARKSTOR"
+VERSION = 1
+HEADER_SIZE = 4096
+
+
+def record_dtype(n_subjects, marks_dtype):
+    return np.dtype([("id", "<i8"), ("name", "<i4"),
+                     ("marks", np.dtype(marks_dtype).newbyteorder("<"), (n_subjects,))])
+
+
+# Refuse values the marks dtype cannot hold exactly (e.g. 300 or 72.5 in uint8)
+def check_marks(marks, dtype):
+    marks = np.asarray(marks, dtype=np.float64)
+    if dtype.kind in "iu":
+        info = np.iinfo(dtype)
+        if marks.size and (marks.min() < info.min or marks.max() > info.max):
+            raise OverflowError(f"marks outside {dtype} range {info.min}..{info.max}")
+        if not np.array_equal(marks, np.round(marks)):
+            raise ValueError(f"fractional marks cannot be stored as {dtype}")
+    return marks.astype(dtype)
+
+
+class MarksStore:
+    def __init__(self, path, mode="r"):
+        self.path = path
+        self.mode = mode
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a marks store")
+            header = json.loads(f.read(HEADER_SIZE - len(MAGIC)).rstrip(b"\0").decode("utf-8"))
+        if header["version"] != VERSION:
+            raise ValueError(f"unsupported marks store version {header['version']}")
+        self.subjects = header["subjects"]
+        self.dtype = record_dtype(len(self.subjects), header["marks_dtype"])
+        with open(self.names_path, "rb") as f:
+            names = f.read()
+        # A name without its newline is left over from an interrupted append
+        self._names_size = names.rfind(b"\n") + 1
+        # split on "\n" only: splitlines() would also break names at \x85, \u2028, ...
+        self.names = names[:self._names_size].decode("utf-8").split("\n")[:-1]
+        self._index = {name: code for code, name in enumerate(self.names)}
+        self._map()
+
+    @property
+    def names_path(self):
+        return self.path + ".names"
+
+    @classmethod
+    def create(cls, path, subjects=SUBJECTS, marks_dtype="float32"):
+        header = json.dumps({"version": VERSION, "subjects": list(subjects),
+                             "marks_dtype": np.dtype(marks_dtype).str}).encode("utf-8")
+        if len(MAGIC) + len(header) > HEADER_SIZE:
+            raise ValueError("too many subjects for the header")
+        with open(path, "wb") as f:
+            f.write(MAGIC + header.ljust(HEADER_SIZE - len(MAGIC), b"\0"))
+        open(path + ".names", "w", encoding="utf-8").close()
+        return cls(path, mode="r+")
+
+    # (Re)open the records as a memory map sized from the file length.
+    # Bytes of a partial trailing record (interrupted append) are not mapped;
+    # the next append() cuts them off before writing.
+    def _map(self):
+        rows = (os.path.getsize(self.path) - HEADER_SIZE) // self.dtype.itemsize
+        if rows == 0:
+            self.records = np.empty(0, dtype=self.dtype)
+        else:
+            self.records = np.memmap(self.path, dtype=self.dtype, mode=self.mode,
+                                     offset=HEADER_SIZE, shape=(rows,))
+
+    def __len__(self):
+        return len(self.records)
+
+    # ------------------------------------------------------------------
+    # Zero-copy views
+    # ------------------------------------------------------------------
+    @property
+    def ids(self):
+        return self.records["id"]
+
+    @property
+    def name_codes(self):
+        return self.records["name"]
+
+    @property
+    def marks(self):
+        return self.records["marks"]
+
+    def subject(self, name):
+        return self.marks[:, self.subjects.index(name)]
+
+    def student_names(self, codes=None):
+        lookup = np.array(self.names, dtype=str)
+        return lookup[self.name_codes if codes is None else codes]
+
+    # ------------------------------------------------------------------
+    # Append
+    # ------------------------------------------------------------------
+    def append(self, ids, names, marks):
+        if self.mode != "r+":
+            raise ValueError("marks store is read-only, open it with mode='r+' to append")
+        marks = np.asarray(marks).reshape(-1, len(self.subjects))
+        block = np.empty(len(marks), dtype=self.dtype)
+        block["id"] = ids
+        block["marks"] = check_marks(marks, self.dtype["marks"].base)
+
+        # Codes for names not stored yet are handed out here, but _index and
+        # names are only updated once both files are written.
+        new_index = {}
+        codes = []
+        for name in names:
+            if "\n" in name:
+                raise ValueError(f"student name {name!r} contains a newline")
+            code = self._index.get(name)
+            if code is None:
+                code = new_index.setdefault(name, len(self.names) + len(new_index))
+            codes.append(code)
+        block["name"] = codes
+        new_names = list(new_index)
+
+        # Names first: a record must never point at a name not yet on disk.
+        # Both files are cut back to their last complete entry before writing,
+        # so leftovers of an interrupted append cannot shift the new data.
+        names_size = self._names_size
+        if new_names:
+            data = "".join(name + "\n" for name in new_names).encode("utf-8")
+            with open(self.names_path, "r+b") as f:
+                f.truncate(names_size)
+                f.seek(names_size)
+                f.write(data)
+            names_size += len(data)
+        end = HEADER_SIZE + len(self) * self.dtype.itemsize
+        self.records = None  # release the old map before growing the file
+        try:
+            with open(self.path, "r+b") as f:
+                f.truncate(end)
+                f.seek(end)
+                f.write(block.tobytes())
+        finally:
+            self._map()
+        self._names_size = names_size
+        self.names.extend(new_names)
+        self._index.update(new_index)
+
+
+# Build a store from students.csv (ID,Name,<subjects...>) chunk by chunk
+def import_csv(csv_file, path, marks_dtype="float32", chunk_rows=DEFAULT_CHUNK_ROWS):
+    with open(csv_file, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        store = MarksStore.create(path, header[2:], marks_dtype)
+        while True:
+            rows = [row for row in islice(reader, chunk_rows) if row]
+            if not rows:
+                return store
+            columns = list(zip(*rows))
+            store.append(np.array(columns[0], dtype=np.int64), columns[1],
+                         np.array(rows, dtype=object)[:, 2:].astype(np.float64))
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "students.marks")
+        store = import_csv(os.path.join(base_path, "students.csv"), path, marks_dtype="uint8")
+        print("Students:", len(store), "| record size:", store.dtype.itemsize, "bytes")
+        math = store.subject("Math")
+        print("Math marks:", math, "| shares memory with the map:",
+              np.shares_memory(math, store.records))
+        print("Names:", store.student_names())
+
+        store.append([6], ["Priya"], [[88, 91, 79]])
+        print("After append:", len(store), "students, Math average", store.subject("Math").mean())
+
+        try:
+            store.append([7], ["Karan"], [[300, 50, 50]])
+        except OverflowError as e:
+            print("Error:", e)
+        del store, math
@@ -0,0 +1,207 @@
+"""
+========================================
+  Student Marks - Bulk Results Writer
+========================================
+
+Program 4 of p27.py writes results.csv with
+    np.savetxt(output_file, result, delimiter=",", header=..., comments='', fmt='%0.2f')
+savetxt formats one row at a time in Python (fmt % tuple(row)), so with
+tens of millions of rows writing takes longer than computing.
+
+write_results() formats whole blocks of rows at once:
+1. each value is turned into hundredths with NumPy: round(|x| * 100)
+2. the digits of every value are computed with integer arithmetic and
+   written into a uint8 array, one fixed-width slot per value; a mask of
+   the bytes in use packs the slots into the finished text
+3. the text is copied into a preallocated byte buffer, which is flushed to
+   the file in large chunks
+With workers > 1 the blocks are formatted in parallel processes and
+written in order.
+
+The output is byte-identical to savetxt(fmt='%0.2f'): values whose
+round(x * 100) could differ from printf rounding (ties, huge numbers,
+nan/inf) are formatted with '%0.2f' itself. Lines end with os.linesep,
+just like savetxt, which writes its file in text mode.
+
+How to use:
+    from marks_writer import write_results
+    write_results("results.csv", result, header="Math,Science,English,Total,Average")
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+DEFAULT_BLOCK_ROWS = 100_000
+DEFAULT_BUFFER_BYTES = 16 * 2 ** 20
+# Above this, x * 100 no longer has 2 exact decimals in a float64
+SAFE_LIMIT = 2.0 ** 52 / 100
+
+
+# ------------------------------------------------------------------
+# Formatting
+# ------------------------------------------------------------------
+
+# Exactly what savetxt(fmt='%0.2f') writes for one row
+def format_row_slow(row, delimiter, newline):
+    return (delimiter.join("%0.2f" % value for value in row) + newline).encode("latin-1")
+
+
+# Rows of hundredths (int64 >= 0) + sign flags → text bytes.
+# Every value gets a right-aligned slot of `width` bytes in a preallocated
+# uint8 array: [sign][integer digits][.][d][d][delimiter or newline].
+# A mask marks the bytes actually used, and boolean indexing packs them in
+# row order - that is the finished text.
+def format_fast(hundredths, negative, delimiter, newline):
+    rows, cols = hundredths.shape
+    integer_part = hundredths // 100
+    fraction = hundredths % 100
+    max_digits = len(str(int(integer_part.max()))) if integer_part.size else 1
+    digits = np.ones(integer_part.shape, dtype=np.int64)
+    for k in range(1, max_digits):
+        digits += integer_part >= 10 ** k
+
+    end_bytes = len(newline)
+    width = 1 + max_digits + 3 + max(len(delimiter), end_bytes)
+    chars = np.zeros((rows, cols, width), dtype=np.uint8)
+    used = np.zeros((rows, cols, width), dtype=bool)
+
+    # separators: delimiter after each value, newline after the last column
+    sep_start = width - max(len(delimiter), end_bytes)
+    for i, byte in enumerate(delimiter.encode("latin-1")):
+        chars[:, :-1, sep_start + i] = byte
+        used[:, :-1, sep_start + i] = True
+    for i, byte in enumerate(newline.encode("latin-1")):
+        chars[:, -1, sep_start + i] = byte
+        used[:, -1, sep_start + i] = True
+
+    chars[:, :, sep_start - 1] = ord("0") + fraction % 10
+    chars[:, :, sep_start - 2] = ord("0") + fraction // 10
+    chars[:, :, sep_start - 3] = ord(".")
+    used[:, :, sep_start - 3:sep_start] = True
+    for k in range(max_digits):
+        position = sep_start - 4 - k
+        chars[:, :, position] = ord("0") + (integer_part // 10 ** k) % 10
+        used[:, :, position] = k < digits
+
+    sign_position = (sep_start - 4 - digits)[..., None]
+    np.put_along_axis(chars, sign_position, np.where(negative, ord("-"), 0)[..., None], axis=2)
+    np.put_along_axis(used, sign_position, negative[..., None], axis=2)
+    return chars[used].tobytes()
+
+
+# Format a 2D float block as '%0.2f' text, one line per row.
+def format_block(block, delimiter=",", newline="\n"):
+    block = np.asarray(block, dtype=np.float64)
+    if block.ndim == 1:
+        block = block.reshape(-1, 1)
+    if block.size == 0:
+        return b""
+
+    with np.errstate(invalid="ignore", over="ignore"):
+        magnitude = np.abs(block)
+        scaled = magnitude * 100
+        # printf rounds the exact binary value; x * 100 may have rounded it,
+        # so rows with a value close to a .5 tie (or too big / not finite)
+        # are written with '%0.2f' itself
+        slow = ~np.isfinite(block) | (magnitude >= SAFE_LIMIT) | \
+            (np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6)
+    slow_rows = np.flatnonzero(slow.any(axis=1))
+    hundredths = np.where(slow, 0, np.round(np.where(slow, 0, scaled))).astype(np.int64)
+    negative = np.signbit(block)
+
+    if len(slow_rows) == 0:
+        return format_fast(hundredths, negative, delimiter, newline)
+    parts = []
+    start = 0
+    for row in slow_rows.tolist():
+        if row > start:
+            parts.append(format_fast(hundredths[start:row], negative[start:row],
+                                     delimiter, newline))
+        parts.append(format_row_slow(block[row], delimiter, newline))
+        start = row + 1
+    if start < len(block):
+        parts.append(format_fast(hundredths[start:], negative[start:], delimiter, newline))
+    return b"".join(parts)
+
+
+def iter_blocks(result, block_rows):
+    for start in range(0, len(result), block_rows):
+        yield result[start:start + block_rows]
+
+
+# ------------------------------------------------------------------
+# Writer
+# ------------------------------------------------------------------
+def write_results(path, result, header="", delimiter=",", block_rows=DEFAULT_BLOCK_ROWS,
+                  buffer_bytes=DEFAULT_BUFFER_BYTES, workers=1, newline=os.linesep):
+    result = np.asarray(result)
+    buffer = bytearray(buffer_bytes)
+    used = 0
+
+    with open(path, "wb") as f:
+        if header:
+            f.write((header + newline).encode("latin-1"))
+
+        n_blocks = (len(result) + block_rows - 1) // block_rows
+        if workers > 1:
+            executor = ProcessPoolExecutor(max_workers=workers)
+            chunks = executor.map(format_block, iter_blocks(result, block_rows),
+                                  [delimiter] * n_blocks, [newline] * n_blocks)
+        else:
+            executor = None
+            chunks = (format_block(block, delimiter, newline)
+                      for block in iter_blocks(result, block_rows))
+
+        try:
+            for chunk in chunks:
+                if used + len(chunk) > buffer_bytes:
+                    f.write(memoryview(buffer)[:used])
+                    used = 0
+                if len(chunk) > buffer_bytes:
+                    f.write(chunk)  # larger than the whole buffer - write directly
+                    continue
+                buffer[used:used + len(chunk)] = chunk
+                used += len(chunk)
+            f.write(memoryview(buffer)[:used])
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    csv_file = os.path.join(base_path, "students.csv")
+    header = "Math,Science,English,Total,Average"
+
+    # Program 4 with the bulk writer
+    marks = np.loadtxt(csv_file, delimiter=",", skiprows=1, usecols=(2, 3, 4))
+    result = np.column_stack((marks, np.sum(marks, axis=1), np.mean(marks, axis=1)))
+    with tempfile.TemporaryDirectory() as tmp:
+        np.savetxt(os.path.join(tmp, "savetxt.csv"), result, delimiter=",", header=header,
+                   comments="", fmt="%0.2f")
+        write_results(os.path.join(tmp, "bulk.csv"), result, header=header)
+        with open(os.path.join(tmp, "savetxt.csv"), "rb") as f, \
+                open(os.path.join(tmp, "bulk.csv"), "rb") as g:
+            print("Identical to savetxt output:", f.read() == g.read())
+
+        # Speed on 1,000,000 students
+        rng = np.random.default_rng(0)
+        marks = rng.integers(0, 101, size=(1_000_000, 3)).astype(np.float64)
+        result = np.column_stack((marks, marks.sum(axis=1), marks.mean(axis=1)))
+
+        start = time.perf_counter()
+        np.savetxt(os.path.join(tmp, "a.csv"), result, delimiter=",", header=header,
+                   comments="", fmt="%0.2f")
+        savetxt_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        write_results(os.path.join(tmp, "b.csv"), result, header=header)
+        bulk_time = time.perf_counter() - start
+
+        with open(os.path.join(tmp, "a.csv"), "rb") as f, open(os.path.join(tmp, "b.csv"), "rb") as g:
+            same = f.read() == g.read()
+        print(f"savetxt: {savetxt_time:.2f}s  write_results: {bulk_time:.2f}s  identical: {same}")